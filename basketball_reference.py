@@ -3,13 +3,27 @@ Basketball Reference Data Fetcher
 Fetches seasonal averages for NBA players from Basketball Reference
 """
 import requests
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import re
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from config import DEBUG_MODE
 
+# orjson reads/writes the disk cache several times faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 
 def debug_print(*args, **kwargs):
     """Print only if DEBUG_MODE is enabled."""
@@ -25,6 +39,10 @@ CACHE_DURATION_HOURS = 24  # Refresh cache every 24 hours (stats don't change th
 _player_stats_cache: Dict[str, Dict] = {}
 _cache_timestamp: Optional[datetime] = None
 
+# (first initial, last name) -> stats, built for the _player_stats_cache dict it indexes
+_partial_name_index: Dict[Tuple[str, str], Dict] = {}
+_partial_name_source: Optional[Dict[str, Dict]] = None
+
 
 def _load_cache_from_disk() -> bool:
     """Load cache from disk if available and fresh."""
@@ -34,8 +52,8 @@ def _load_cache_from_disk() -> bool:
         return False
     
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(CACHE_FILE, 'rb') as f:
+            data = _json_loads(f.read())
         
         # Check timestamp
         timestamp_str = data.get('_timestamp')
@@ -73,8 +91,8 @@ def _save_cache_to_disk():
             'players': _player_stats_cache
         }
         
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
+        with open(CACHE_FILE, 'wb') as f:
+            f.write(_json_dumps(data))
         
         debug_print(f"[BBRef] Saved {len(_player_stats_cache)} players to disk cache")
         
@@ -82,6 +100,7 @@ def _save_cache_to_disk():
         debug_print(f"[BBRef] Error saving disk cache: {e}")
 
 
+@lru_cache(maxsize=4096)
 def _normalize_name(name: str) -> str:
     """Normalize player name for matching."""
     if not name:
@@ -340,21 +359,23 @@ def get_player_stats_by_name(player_name: str) -> Optional[Dict]:
     if normalized in _player_stats_cache:
         return _player_stats_cache[normalized]
     
-    # Try partial matching
-    for cached_name, stats in _player_stats_cache.items():
-        # Check if all parts of the search name are in the cached name
-        search_parts = normalized.split()
-        cached_parts = cached_name.split()
-        
-        if len(search_parts) >= 2 and len(cached_parts) >= 2:
-            # Match first and last name
-            if search_parts[0] == cached_parts[0] and search_parts[-1] == cached_parts[-1]:
-                return stats
-            # Or last name + first initial
-            if search_parts[-1] == cached_parts[-1] and search_parts[0][0] == cached_parts[0][0]:
-                return stats
+    # Partial match: same last name and first initial (a full first-name match implies
+    # the initial), earliest cached player wins. Indexed once per cache instead of scanned
+    search_parts = normalized.split()
+    if len(search_parts) < 2:
+        return None
     
-    return None
+    global _partial_name_index, _partial_name_source
+    if _partial_name_source is not _player_stats_cache:
+        index = {}
+        for cached_name, stats in _player_stats_cache.items():
+            cached_parts = cached_name.split()
+            if len(cached_parts) >= 2:
+                index.setdefault((cached_parts[0][0], cached_parts[-1]), stats)
+        _partial_name_index = index
+        _partial_name_source = _player_stats_cache
+    
+    return _partial_name_index.get((search_parts[0][0], search_parts[-1]))
 
 
 def convert_to_yahoo_stat_ids(bbref_stats: Dict) -> Dict:
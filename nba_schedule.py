@@ -2,19 +2,70 @@
 NBA Schedule - Get games per week for each team
 """
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import gzip
 import json
+import logging
 import os
-from bs4 import BeautifulSoup
+import time
 import re
+import sys
+import threading
 from config import DEBUG_MODE
 
-def debug_print(*args, **kwargs):
-    """Print only if DEBUG_MODE is enabled."""
-    if DEBUG_MODE:
-        print(*args, **kwargs)
+# orjson parses the multi-MB schedule payload (and our disk caches) several times faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+logger = logging.getLogger(__name__)
+
+# DEBUG_MODE enables this module's debug output; otherwise debug calls are
+# dropped before their %-style messages are ever formatted
+if DEBUG_MODE:
+    logging.basicConfig(format='%(message)s')
+    logger.setLevel(logging.DEBUG)
+
+
+@lru_cache(maxsize=1)
+def _pacific_time_for_minute(minute_key: int) -> datetime:
+    """Pacific time computed once per wall-clock minute (see get_pacific_time)."""
+    now = datetime.now()
+    # Determine if we're in DST (PDT) or standard time (PST)
+    # Approximate: DST is roughly March-November
+    is_dst = 3 <= now.month <= 10
+    pst_offset = -7 if is_dst else -8
+    return now + timedelta(hours=pst_offset)
+
+
+@lru_cache(maxsize=1)
+def _pacific_date_for_minute(minute_key: int) -> datetime:
+    """Pacific midnight computed once per wall-clock minute (see get_pacific_date)."""
+    return _pacific_time_for_minute(minute_key).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@lru_cache(maxsize=1)
+def _current_week_start_str(minute_key: int) -> str:
+    """Current fantasy week's Monday (Pacific Time) as 'YYYY-MM-DD', computed once per minute."""
+    today_pacific = _pacific_time_for_minute(minute_key)
+    days_since_monday = today_pacific.weekday()  # Monday = 0
+    return (today_pacific - timedelta(days=days_since_monday)).strftime('%Y-%m-%d')
 
 
 def get_pacific_time() -> datetime:
@@ -24,31 +75,58 @@ def get_pacific_time() -> datetime:
     
     PST = UTC-8 (Winter: roughly November-March)
     PDT = UTC-7 (Summer: roughly March-November)
+    
+    Memoized per minute - request bursts evaluating many players share one value.
     """
-    now = datetime.now()
-    # Determine if we're in DST (PDT) or standard time (PST)
-    # Approximate: DST is roughly March-November
-    is_dst = 3 <= now.month <= 10
-    pst_offset = -7 if is_dst else -8
-    return now + timedelta(hours=pst_offset)
+    return _pacific_time_for_minute(int(time.time()) // 60)
 
 
 def get_pacific_date() -> datetime:
     """Get current date in Pacific Time (midnight)"""
-    return get_pacific_time().replace(hour=0, minute=0, second=0, microsecond=0)
+    return _pacific_date_for_minute(int(time.time()) // 60)
+
+
+# NBA Official API - full season schedule
+NBA_SCHEDULE_URL = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
+
+# Request headers shared by both clients. The CDN gzips the schedule JSON to a fraction
+# of its size, and its ETag is per encoding - revalidation must ask for the same one
+_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+# Thin HTTP pool for conditional-GET revalidation (no requests overhead on the 304 path)
+_POOL = urllib3.PoolManager(num_pools=2, maxsize=8, headers=_HTTP_HEADERS,
+                            retries=urllib3.Retry(total=3, backoff_factor=0.5))
 
+# Shared keep-alive session for NBA CDN / hashtagbasketball fetches (no TCP+TLS handshake per call)
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                    max_retries=urllib3.Retry(total=2, backoff_factor=0.3)))
+_HTTP.headers.update(_HTTP_HEADERS)
 
-# Cache file for disk persistence
+# Cache file for disk persistence - one file, with an 'nba' and a 'hashtag' section
 SCHEDULE_CACHE_FILE = 'nba_schedule_disk_cache.json'
 WEEKLY_CACHE_TTL_HOURS = 24  # Cache for 24 hours (schedule doesn't change often)
+SCHEDULE_CACHE_SCHEMA = 3  # Bump when the layout of anything stored in SCHEDULE_CACHE_FILE changes
 
-# In-memory cache for today's games (refreshes once per day)
+# In-memory slice of today's games from the weekly schedule (refreshes once per day)
 _todays_games_cache: Dict[str, Dict] = {}
 _todays_games_date: Optional[str] = None
 
 # In-memory cache for weekly schedule (refreshes once per hour)
 _weekly_schedule_cache: Dict[str, List[Dict]] = {}
 _weekly_schedule_timestamp: Optional[datetime] = None
+_weekly_schedule_validators: Dict[str, str] = {}  # ETag / Last-Modified of the last full fetch
+
+# Per-team index over _weekly_schedule_cache (see _get_team_index)
+_team_index: Dict[str, Tuple[List[str], List[Dict]]] = {}
+_team_index_source: Optional[Dict] = None
+
+# Raw parsed scheduleLeagueV2.json shared by the per-team/per-week queries (refreshes hourly)
+_league_schedule_cache: Dict[str, Any] = {'data': None, 'by_date': {}, 'validators': {}, 'fetched_at': 0.0}
+LEAGUE_SCHEDULE_TTL_SECONDS = 3600
 
 # Flag to track if disk cache was loaded
 _schedule_cache_loaded = False
@@ -56,67 +134,194 @@ _schedule_cache_loaded = False
 # Cache for hashtagbasketball scraped schedule (refreshes once per day)
 _hashtag_schedule_cache: Dict[str, List[str]] = {}
 _hashtag_schedule_date: Optional[str] = None
-HASHTAG_CACHE_FILE = 'hashtag_schedule_cache.json'
+_hashtag_validators: Dict[str, str] = {}  # ETag / Last-Modified of the last scrape
+_hashtag_cache_version = 0  # Bumped whenever _hashtag_schedule_cache is replaced or re-dated
+_hashtag_refresh_lock = threading.Lock()  # Held while a background re-scrape is in flight
+_hashtag_refresh_started_at = 0.0
+HASHTAG_REFRESH_RETRY_SECONDS = 300
+
+# get_teams_playing_on_date results from live sources (scrape / NBA API): the
+# (_hashtag_cache_version, today) they are valid for, and {date: teams}. Fallbacks are not kept
+_teams_on_date_memo: Tuple[Optional[Tuple[int, str]], Dict[str, Tuple[str, ...]]] = (None, {})
+
+# Last parsed contents of SCHEDULE_CACHE_FILE and the mtime they were read at
+_disk_cache_data: Dict[str, Any] = {}
+_disk_cache_mtime = 0.0
+
+# Disk writes run on one background thread (see _save_in_background)
+_disk_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='schedule-cache-writer')
+_saved_weekly_schedule_timestamp: Optional[datetime] = None  # Fetch time of the last weekly save
+
+
+def _read_disk_cache() -> Dict[str, Any]:
+    """
+    Parsed SCHEDULE_CACHE_FILE. The file is only reopened when its mtime has
+    changed since the last read, so repeated lookups cost a single stat().
+    """
+    global _disk_cache_data, _disk_cache_mtime
+    
+    try:
+        mtime = os.stat(SCHEDULE_CACHE_FILE).st_mtime
+    except OSError:
+        return {}
+    
+    if mtime != _disk_cache_mtime:
+        with open(SCHEDULE_CACHE_FILE, 'rb') as f:
+            data = _json_loads(f.read())
+        # Files written in an older layout are ignored (and overwritten on the next save)
+        _disk_cache_data = data if data.get('schema') == SCHEDULE_CACHE_SCHEMA else {}
+        _disk_cache_mtime = mtime
+    return _disk_cache_data
+
+
+def _write_disk_cache(section: str, payload: Dict[str, Any]):
+    """Replace one section ('nba' or 'hashtag') of SCHEDULE_CACHE_FILE, keeping the other."""
+    global _disk_cache_data, _disk_cache_mtime
+    
+    try:
+        data = dict(_read_disk_cache())
+    except Exception:
+        data = {}
+    data[section] = payload
+    data['schema'] = SCHEDULE_CACHE_SCHEMA
+    
+    # Write-then-rename, so a concurrent _read_disk_cache never sees a half-written file
+    tmp_file = SCHEDULE_CACHE_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(_json_dumps(data))
+    os.replace(tmp_file, SCHEDULE_CACHE_FILE)
+    _disk_cache_data = data
+    _disk_cache_mtime = os.stat(SCHEDULE_CACHE_FILE).st_mtime
 
 
 def _load_schedule_cache_from_disk():
     """Load schedule cache from disk."""
-    global _todays_games_cache, _todays_games_date
-    global _weekly_schedule_cache, _weekly_schedule_timestamp
+    global _weekly_schedule_cache, _weekly_schedule_timestamp, _weekly_schedule_validators
     global _schedule_cache_loaded
     
     if _schedule_cache_loaded:
         return
     
-    if not os.path.exists(SCHEDULE_CACHE_FILE):
-        _schedule_cache_loaded = True
-        return
-    
     try:
-        with open(SCHEDULE_CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_disk_cache().get('nba', {})
         
         now = datetime.now()
-        today_str = now.strftime('%Y-%m-%d')
-        
-        # Load today's games (only if still today)
-        if data.get('todays_games_date') == today_str:
-            _todays_games_cache = data.get('todays_games', {})
-            _todays_games_date = data.get('todays_games_date')
-            debug_print(f"[NBA Schedule] Loaded today's games from disk ({len(_todays_games_cache)} teams)")
         
         # Load weekly schedule (check if still valid)
         if data.get('weekly_schedule_timestamp'):
             cached_time = datetime.fromisoformat(data['weekly_schedule_timestamp'])
             age_hours = (now - cached_time).total_seconds() / 3600
             
-            if age_hours < WEEKLY_CACHE_TTL_HOURS:
+            if age_hours < WEEKLY_CACHE_TTL_HOURS or data.get('weekly_schedule_validators'):
+                # Expired entries are kept when we can revalidate them with a conditional GET
                 _weekly_schedule_cache = data.get('weekly_schedule', {})
                 _weekly_schedule_timestamp = cached_time
-                debug_print(f"[NBA Schedule] Loaded weekly schedule from disk ({len(_weekly_schedule_cache)} dates, {age_hours:.1f}h old)")
+                _weekly_schedule_validators = data.get('weekly_schedule_validators') or {}
+                logger.debug("[NBA Schedule] Loaded weekly schedule from disk (%s dates, %.1fh old)", len(_weekly_schedule_cache), age_hours)
         
         _schedule_cache_loaded = True
         
     except Exception as e:
-        debug_print(f"[NBA Schedule] Error loading cache from disk: {e}")
+        logger.debug("[NBA Schedule] Error loading cache from disk: %s", e)
         _schedule_cache_loaded = True
 
 
+def _save_in_background(save_fn):
+    """Queue a disk-cache save on the single writer thread: off the request path, still in order."""
+    _disk_writer.submit(save_fn)
+
+
 def _save_schedule_cache_to_disk():
-    """Save schedule cache to disk."""
+    """Save schedule cache to disk (skipped if this exact fetch is already saved)."""
+    global _saved_weekly_schedule_timestamp
+    
+    if _weekly_schedule_timestamp == _saved_weekly_schedule_timestamp:
+        return
+    
     try:
         data = {
-            'todays_games': _todays_games_cache,
-            'todays_games_date': _todays_games_date,
             'weekly_schedule': _weekly_schedule_cache,
-            'weekly_schedule_timestamp': _weekly_schedule_timestamp.isoformat() if _weekly_schedule_timestamp else None
+            'weekly_schedule_timestamp': _weekly_schedule_timestamp.isoformat() if _weekly_schedule_timestamp else None,
+            'weekly_schedule_validators': _weekly_schedule_validators
         }
         
-        with open(SCHEDULE_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
+        _write_disk_cache('nba', data)
+        _saved_weekly_schedule_timestamp = _weekly_schedule_timestamp
         
     except Exception as e:
-        debug_print(f"[NBA Schedule] Error saving cache to disk: {e}")
+        logger.debug("[NBA Schedule] Error saving cache to disk: %s", e)
+
+
+def _conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from stored validators."""
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def _response_validators(response_headers) -> Dict[str, str]:
+    """Extract the ETag / Last-Modified validators from a 200 response."""
+    validators = {}
+    if response_headers.get('ETag'):
+        validators['etag'] = response_headers['ETag']
+    if response_headers.get('Last-Modified'):
+        validators['last_modified'] = response_headers['Last-Modified']
+    return validators
+
+
+def _schedule_not_modified(validators: Dict[str, str]) -> bool:
+    """
+    Revalidate the cached NBA schedule with a conditional GET.
+    Returns True only on 304 Not Modified; any other outcome means refetch.
+    """
+    headers = _conditional_headers(validators)
+    if not headers:
+        return False
+    
+    try:
+        # Per-request headers replace the pool defaults in urllib3, so merge them in
+        response = _POOL.request('GET', NBA_SCHEDULE_URL, headers={**_HTTP_HEADERS, **headers},
+                                 timeout=10.0, preload_content=False)
+        response.release_conn()
+        return response.status == 304
+    except Exception as e:
+        logger.debug("[NBA Schedule] Revalidation error: %s", e)
+        return False
+
+
+# Grid header parsing: "Mon 2/14" style month/day, or a bare day name
+_HEADER_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})')
+_DAY_NAME_RE = re.compile(r'\b(mon|tue|wed|thu|fri|sat|sun)', re.I)
+_DAY_OFFSET = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+
+# Grid cell classes that mark a scheduled game
+_GAME_CELL_CLASSES = frozenset({'game', 'playing'})
+
+def _first(elements: list):
+    """First element of an XPath result, or None."""
+    return elements[0] if elements else None
+
+
+def _cell_text(element) -> str:
+    """Element text with each text node stripped, like BeautifulSoup's get_text(strip=True)."""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _save_hashtag_cache_to_disk():
+    """Save the scraped hashtagbasketball schedule (and its validators) to disk."""
+    try:
+        cache_obj = {
+            'date': str(_hashtag_schedule_date),
+            'schedule': _hashtag_schedule_cache,
+            'validators': _hashtag_validators
+        }
+        _write_disk_cache('hashtag', cache_obj)
+        logger.debug("[HashtagBB] Saved cache to %s", SCHEDULE_CACHE_FILE)
+    except Exception as e:
+        logger.debug("[HashtagBB] Error saving cache: %s", e, exc_info=True)
 
 
 def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
@@ -124,9 +329,14 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
     Fetch NBA schedule from hashtagbasketball.com's advanced schedule grid.
     Returns dict: {date_str: [list of team abbreviations playing that day]}
     
-    Uses caching - only fetches once per day.
+    Uses caching - only fetches once per day, and the daily refresh is a
+    conditional GET (ETag / Last-Modified) that skips parsing on 304.
+    Once a previous day's schedule is cached, it is served immediately while
+    the refresh runs in a background thread (stale-while-revalidate); only a
+    cold start blocks on the scrape.
     """
-    global _hashtag_schedule_cache, _hashtag_schedule_date
+    global _hashtag_schedule_cache, _hashtag_schedule_date, _hashtag_validators
+    global _hashtag_cache_version, _hashtag_refresh_started_at
     
     # Get today's date as YYYY-MM-DD string
     today_date = datetime.now().date()
@@ -134,51 +344,101 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
     
     # Check if we have cached data for today (in-memory cache)
     if _hashtag_schedule_date == today and _hashtag_schedule_cache:
-        debug_print(f"[HashtagBB] Using in-memory cached schedule ({len(_hashtag_schedule_cache)} dates)")
+        logger.debug("[HashtagBB] Using in-memory cached schedule (%s dates)", len(_hashtag_schedule_cache))
         return _hashtag_schedule_cache
     
-    # Try to load from disk cache
-    if os.path.exists(HASHTAG_CACHE_FILE):
-        try:
-            with open(HASHTAG_CACHE_FILE, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+    # Try to load from disk cache (a stat() only, unless the file changed since last read)
+    try:
+        cache_data = _read_disk_cache().get('hashtag')
+    except Exception as e:
+        logger.debug("[HashtagBB] Error loading cache: %s", e)
+        cache_data = None
+    
+    if cache_data:
+        if cache_data.get('date') == today:
+            disk_schedule = cache_data.get('schedule', {})
             
-            if cache_data.get('date') == today:
-                disk_schedule = cache_data.get('schedule', {})
-                
-                _hashtag_schedule_cache = disk_schedule
-                _hashtag_schedule_date = today
-                debug_print(f"[HashtagBB] Loaded schedule from disk cache ({len(_hashtag_schedule_cache)} dates)")
-                return _hashtag_schedule_cache
-        except Exception as e:
-            debug_print(f"[HashtagBB] Error loading cache: {e}")
+            _hashtag_schedule_cache = disk_schedule
+            _hashtag_schedule_date = today
+            _hashtag_validators = cache_data.get('validators') or {}
+            _hashtag_cache_version += 1
+            logger.debug("[HashtagBB] Loaded schedule from disk cache (%s dates)", len(_hashtag_schedule_cache))
+            return _hashtag_schedule_cache
+        
+        # Stale copy - keep it (and its validators, so the refresh can be a conditional GET)
+        if not _hashtag_schedule_cache:
+            _hashtag_schedule_cache = cache_data.get('schedule', {})
+            _hashtag_validators = cache_data.get('validators') or {}
     
-    debug_print("[HashtagBB] Fetching schedule from hashtagbasketball.com...")
+    if _hashtag_schedule_cache:
+        # Serve the stale schedule now; at most one background refresh in flight,
+        # and failed refreshes are not retried more than once per interval
+        if _hashtag_scrape_due() and _hashtag_refresh_lock.acquire(blocking=False):
+            _hashtag_refresh_started_at = time.time()
+            threading.Thread(target=_refresh_hashtag_cache_in_background, daemon=True).start()
+        logger.debug("[HashtagBB] Serving stale schedule from %s while refreshing", _hashtag_schedule_date)
+        return _hashtag_schedule_cache
+    
+    # Nothing cached: the scrape has to block, so a failed one is retried at most once per interval
+    if not _hashtag_scrape_due():
+        logger.debug("[HashtagBB] No schedule cached; last scrape attempt too recent, skipping")
+        return _hashtag_schedule_cache
+    _hashtag_refresh_started_at = time.time()
+    return _scrape_hashtag_schedule(today)
+
+
+def _hashtag_scrape_due() -> bool:
+    """True once HASHTAG_REFRESH_RETRY_SECONDS have passed since the last scrape attempt."""
+    return time.time() - _hashtag_refresh_started_at >= HASHTAG_REFRESH_RETRY_SECONDS
+
+
+def _refresh_hashtag_cache_in_background():
+    """Thread target: re-scrape hashtagbasketball and release the refresh lock."""
+    try:
+        _scrape_hashtag_schedule(datetime.now().strftime('%Y-%m-%d'))
+    finally:
+        _hashtag_refresh_lock.release()
+
+
+def _scrape_hashtag_schedule(today: str) -> Dict[str, List[str]]:
+    """Download and parse the schedule grid into the hashtag cache (stamped as today)."""
+    # Imported here: lxml is only needed on a scrape, and most processes never scrape
+    import lxml.html
+    global _hashtag_schedule_cache, _hashtag_schedule_date, _hashtag_validators
+    global _hashtag_cache_version
+    
+    logger.debug("[HashtagBB] Fetching schedule from hashtagbasketball.com...")
     
     try:
         url = "https://hashtagbasketball.com/advanced-nba-schedule-grid"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        headers = _conditional_headers(_hashtag_validators) if _hashtag_schedule_cache else {}
+        response = _HTTP.get(url, headers=headers, timeout=15)
         
-        response = requests.get(url, headers=headers, timeout=15)
+        # Page unchanged since the last scrape - no HTML parsing needed
+        if response.status_code == 304 and _hashtag_schedule_cache:
+            logger.debug("[HashtagBB] Schedule not modified (304), reusing cached schedule")
+            _hashtag_schedule_date = today
+            _hashtag_cache_version += 1
+            _save_in_background(_save_hashtag_cache_to_disk)
+            return _hashtag_schedule_cache
         
         if response.status_code != 200:
-            debug_print(f"[HashtagBB] Failed to fetch: HTTP {response.status_code}")
+            logger.debug("[HashtagBB] Failed to fetch: HTTP %s", response.status_code)
             # Return empty dict - will fallback to NBA API or HARDCODED in get_teams_playing_on_date
             return {}
         
-        soup = BeautifulSoup(response.text, 'lxml')
+        tree = lxml.html.fromstring(response.content)
         
         # Find the schedule table by ID (ContentPlaceHolder1_w16_GridView1)
-        table = soup.find('table', id=lambda x: x and 'GridView' in x)
+        tables = tree.xpath('//table[contains(@id, "GridView")]')
         
-        if not table:
+        if not tables:
             # Fallback: find by class
-            table = soup.find('table', class_='table--statistics')
+            tables = tree.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " table--statistics ")]')
         
-        if not table:
-            debug_print("[HashtagBB] Could not find schedule table in HTML")
+        table = tables[0] if tables else None
+        if table is None:
+            logger.debug("[HashtagBB] Could not find schedule table in HTML")
             # Return empty dict - will fallback to NBA API or HARDCODED
             return {}
         
@@ -187,14 +447,14 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
         
         
         # Get header row to extract dates and day names
-        thead = table.find('thead')
-        if not thead:
-            thead = table.find('tr')
+        thead = _first(table.xpath('.//thead'))
+        if thead is None:
+            thead = _first(table.xpath('.//tr'))
         
         # Extract column headers (dates with day names)
         date_columns = []  # Will store date strings in YYYY-MM-DD format
-        if thead:
-            header_row = thead.find_all('th') or thead.find_all('td')
+        if thead is not None:
+            header_row = thead.xpath('.//th') or thead.xpath('.//td')
             
             # Get current week's Monday (start of NBA fantasy week) - Pacific Time
             now_pacific = get_pacific_time()
@@ -204,63 +464,48 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
             
             # Skip first 2 columns (Team, Games)
             for i, cell in enumerate(header_row[2:]):
-                header_text = cell.get_text(strip=True)
+                header_text = _cell_text(cell)
                 
                 # Try to extract actual date from header text
                 # Formats: "Mon 2/14", "Monday 2/14", "2/14", "Feb 14", etc.
                 date_str = None
                 
                 # Look for month/day pattern (2/14, 02/14, etc.)
-                import re
-                date_match = re.search(r'(\d{1,2})/(\d{1,2})', header_text)
+                date_match = _HEADER_DATE_RE.search(header_text)
                 if date_match:
                     month = int(date_match.group(1))
                     day = int(date_match.group(2))
                     try:
                         parsed_date = datetime(current_year, month, day)
                         date_str = parsed_date.strftime('%Y-%m-%d')
-                        debug_print(f"[HashtagBB] Parsed date from header '{header_text}': {date_str}")
+                        logger.debug("[HashtagBB] Parsed date from header '%s': %s", header_text, date_str)
                     except:
                         pass
                 
                 # If no explicit date found, fallback to day name mapping
                 if not date_str:
-                    day_name = header_text.lower()
-                    day_map = {
-                        'monday': 0, 'mon': 0,
-                        'tuesday': 1, 'tue': 1, 'tues': 1,
-                        'wednesday': 2, 'wed': 2,
-                        'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
-                        'friday': 4, 'fri': 4,
-                        'saturday': 5, 'sat': 5,
-                        'sunday': 6, 'sun': 6
-                    }
-                    
-                    day_offset = None
-                    for key, offset in day_map.items():
-                        if key in day_name:
-                            day_offset = offset
-                            break
+                    day_match = _DAY_NAME_RE.search(header_text)
+                    day_offset = _DAY_OFFSET[day_match.group(1).lower()] if day_match else None
                     
                     if day_offset is not None:
                         date = week_start + timedelta(days=day_offset)
                         date_str = date.strftime('%Y-%m-%d')
-                        debug_print(f"[HashtagBB] Inferred date from day name '{header_text}': {date_str}")
+                        logger.debug("[HashtagBB] Inferred date from day name '%s': %s", header_text, date_str)
                 
                 date_columns.append(date_str)
         
         # Parse data rows
-        tbody = table.find('tbody') or table
-        rows = tbody.find_all('tr')
+        tbody = _first(table.xpath('.//tbody'))
+        rows = (tbody if tbody is not None else table).xpath('.//tr')
         
         for row in rows:
-            cells = row.find_all('td')
+            cells = row.xpath('.//td')
             if len(cells) < 3:  # Need at least Team + Games + 1 day
                 continue
             
             # First cell is team name/abbreviation
             team_cell = cells[0]
-            team_text = team_cell.get_text(strip=True)
+            team_text = _cell_text(team_cell)
             
             # Extract 3-letter abbreviation (usually at start or in data attribute)
             team_abbr = None
@@ -268,33 +513,33 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
                 team_abbr = team_cell.get('data-team').upper()[:3]
             else:
                 # Try to extract from text (e.g., "ATL Hawks" -> "ATL")
-                parts = team_text.split()
+                # Lowercase and split once per row; every check below reuses these
                 team_name_lower = team_text.lower()
+                parts = team_name_lower.split()
                 
-                # Special handling for teams with non-standard abbreviations
-                if 'lakers' in team_name_lower or 'los angeles lakers' in team_name_lower:
-                    team_abbr = 'LAL'
-                elif 'clippers' in team_name_lower or 'los angeles clippers' in team_name_lower:
-                    team_abbr = 'LAC'
-                elif 'knicks' in team_name_lower or 'new york knicks' in team_name_lower:
-                    team_abbr = 'NYK'
-                elif 'spurs' in team_name_lower or 'san antonio spurs' in team_name_lower:
-                    team_abbr = 'SAS'
-                elif 'warriors' in team_name_lower or 'golden state warriors' in team_name_lower:
-                    team_abbr = 'GSW'
-                elif 'pelicans' in team_name_lower or 'new orleans pelicans' in team_name_lower:
-                    team_abbr = 'NOP'
-                elif 'suns' in team_name_lower or 'phoenix suns' in team_name_lower:
-                    team_abbr = 'PHO'
-                elif parts and len(parts[0]) == 3:
-                    team_abbr = parts[0].upper()
-                elif parts:
-                    # Try to match full name to abbreviation
-                    for abbr, full_name in NBA_TEAMS.items():
-                        if full_name.lower() in team_name_lower or abbr.lower() in team_name_lower:
-                            team_abbr = abbr
-                            break
-            
+                # One hash probe per word; nicknames win over a leading abbreviation
+                team_abbr = next(
+                    (TEAM_NAME_TO_ABBR[token] for token in parts if token in TEAM_NAME_TO_ABBR),
+                    None
+                )
+                if not team_abbr and parts:
+                    if len(parts[0]) == 3:
+                        team_abbr = parts[0].upper()
+                    else:
+                        # Text nodes are joined without spaces ("LALLakers") - match by substring,
+                        # longest name first so "hornets" isn't read as "nets"
+                        name = max((name for name in TEAM_NAME_TO_ABBR if name in team_name_lower),
+                                   key=len, default=None)
+                        team_abbr = TEAM_NAME_TO_ABBR.get(name)
+
+                        if not team_abbr:
+                            # City only ("Atlanta") or abbreviation glued to other text - match
+                            # full name or abbreviation by substring
+                            for abbr, full_name in NBA_TEAMS.items():
+                                if full_name.lower() in team_name_lower or abbr.lower() in team_name_lower:
+                                    team_abbr = abbr
+                                    break
+
             if not team_abbr or len(team_abbr) != 3:
                 continue
             
@@ -308,7 +553,7 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
                     continue
                 
                 # Check if team has game on this date
-                cell_text = cell.get_text(strip=True)
+                cell_text = _cell_text(cell)
                 
                 # Check for game indicators:
                 # - "@XXX" or "vs XXX" (opponent notation)
@@ -321,15 +566,13 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
                     if 'all-star' in cell_lower or 'allstar' in cell_lower or 'asg' in cell_lower:
                         has_game = False
                     # Check for opponent indicators
-                    elif '@' in cell_text or 'vs' in cell_text.lower():
-                        has_game = True
-                    # Or check cell background color/class (often colored when there's a game)
-                    elif cell.get('class'):
-                        cell_classes = ' '.join(cell.get('class', []))
-                        has_game = 'game' in cell_classes or 'playing' in cell_classes
-                    # Or just non-empty
-                    elif len(cell_text) > 0:
+                    elif '@' in cell_text or 'vs' in cell_lower:
                         has_game = True
+                    else:
+                        # Or check cell background color/class (often colored when there's a game),
+                        # otherwise just non-empty
+                        cell_classes = cell.get('class')
+                        has_game = not cell_classes or not _GAME_CELL_CLASSES.isdisjoint(cell_classes.split())
                 
                 if has_game:
                     if date_str not in return_data:
@@ -338,7 +581,7 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
                         return_data[date_str].append(team_abbr)
         
         if return_data:
-            debug_print(f"[HashtagBB] Successfully scraped schedule: {len(return_data)} dates, {sum(len(teams) for teams in return_data.values())} team-games")
+            logger.debug("[HashtagBB] Successfully scraped schedule: %s dates, %s team-games", len(return_data), sum(len(teams) for teams in return_data.values()))
             
             # Ensure all data is JSON-serializable (convert any datetime to strings)
             clean_schedule_data = {}
@@ -351,30 +594,19 @@ def fetch_schedule_from_hashtagbasketball() -> Dict[str, List[str]]:
             # Cache the results
             _hashtag_schedule_cache = clean_schedule_data
             _hashtag_schedule_date = today
+            _hashtag_validators = _response_validators(response.headers)
+            _hashtag_cache_version += 1
             
             # Save to disk
-            try:
-                cache_obj = {
-                    'date': str(today),
-                    'schedule': clean_schedule_data
-                }
-                with open(HASHTAG_CACHE_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(cache_obj, f, ensure_ascii=False, indent=2)
-                debug_print(f"[HashtagBB] Saved cache to {HASHTAG_CACHE_FILE}")
-            except Exception as e:
-                debug_print(f"[HashtagBB] Error saving cache: {e}")
-                import traceback
-                traceback.print_exc()
+            _save_in_background(_save_hashtag_cache_to_disk)
             
             return clean_schedule_data
         else:
-            debug_print("[HashtagBB] No schedule data found in table")
+            logger.debug("[HashtagBB] No schedule data found in table")
             return _hashtag_schedule_cache or {}
         
     except Exception as e:
-        debug_print(f"[HashtagBB] Error scraping schedule: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("[HashtagBB] Error scraping schedule: %s", e, exc_info=True)
         return _hashtag_schedule_cache or {}
 
 
@@ -417,14 +649,51 @@ NBA_TEAMS = {
     'WAS': 'Washington Wizards',
 }
 
+# Standard 3-letter codes only (NBA_TEAMS also carries short aliases like 'GS')
+_STANDARD_TEAMS = frozenset(abbr for abbr in NBA_TEAMS if len(abbr) == 3)
+
+# Alternate abbreviations seen across sources (Yahoo, NBA API, hashtagbasketball) -> canonical
+TEAM_ABBR_VARIATIONS = {
+    'GS': 'GSW',
+    'NO': 'NOP',
+    'NY': 'NYK',
+    'PHX': 'PHO',
+    'SA': 'SAS',
+    'BRK': 'BKN',
+    'CHO': 'CHA',
+}
+
+
+def _canon_abbr(abbr: str) -> str:
+    """Map any known spelling of a team abbreviation to its canonical form."""
+    return TEAM_ABBR_VARIATIONS.get(abbr, abbr)
+
+
+@lru_cache(maxsize=128)
+def _normalize_team_abbr(abbr: str) -> str:
+    """Normalize a raw team abbreviation (case, whitespace, aliases); memoized - ~30 distinct inputs."""
+    return _canon_abbr(abbr.upper().strip())
+
+
 # Reverse mapping
+# Full names, nicknames and common short forms -> standard 3-letter code
 TEAM_NAME_TO_ABBR = {}
-for abbr, name in NBA_TEAMS.items():
+for abbr in sorted(_STANDARD_TEAMS):
+    name = NBA_TEAMS[abbr]
     TEAM_NAME_TO_ABBR[name.lower()] = abbr
     # Also add partial names
     TEAM_NAME_TO_ABBR[name.split()[-1].lower()] = abbr
+TEAM_NAME_TO_ABBR.update({
+    'suns': 'PHO',  # PHX sorts after PHO; Yahoo uses PHO
+    'cavs': 'CLE',
+    'mavs': 'DAL',
+    'wolves': 'MIN',
+    'sixers': 'PHI',
+    'pels': 'NOP',
+})
 
 CACHE_FILE = 'nba_schedule_cache.json'
+CACHE_FILE_GZ = CACHE_FILE + '.gz'
 
 # Hardcoded schedule from hashtagbasketball.com for current weeks
 # Source: https://hashtagbasketball.com/advanced-nba-schedule-grid
@@ -531,6 +800,118 @@ WEEKLY_GAMES = {
 }
 
 
+def _build_team_dates_index(schedule_by_date: Dict[str, List[str]]) -> Dict[str, frozenset]:
+    """Invert a {date_str: [teams]} schedule into {canonical_abbr: frozenset(date_strs)}."""
+    team_dates = defaultdict(set)
+    for date_str, teams in schedule_by_date.items():
+        for team in teams:
+            team_dates[_canon_abbr(team)].add(date_str)
+    return {team: frozenset(dates) for team, dates in team_dates.items()}
+
+
+# WEEKLY_GAMES keyed by canonical abbreviation, so lookups never need the alias loop
+_WEEKLY_GAMES_CANONICAL: Dict[str, Dict[str, int]] = {
+    week_start_str: {_canon_abbr(abbr): games for abbr, games in week_games.items()}
+    for week_start_str, week_games in WEEKLY_GAMES.items()
+}
+
+# Inverted index of HARDCODED_SCHEDULE: a team's game days are a single dict lookup
+HARDCODED_BY_TEAM: Dict[str, frozenset] = _build_team_dates_index(HARDCODED_SCHEDULE)
+
+
+def team_plays_on(date_str: str, team_abbr: str) -> bool:
+    """O(1) check whether a team plays on a date according to HARDCODED_SCHEDULE."""
+    return date_str in HARDCODED_BY_TEAM.get(_canon_abbr(team_abbr), ())
+
+
+def _get_league_schedule(ttl: float = LEAGUE_SCHEDULE_TTL_SECONDS) -> Optional[Dict]:
+    """
+    Parsed scheduleLeagueV2.json, downloaded and decoded at most once per ttl seconds
+    so consecutive per-team queries share a single parse. Returns None if unavailable.
+    """
+    if _league_schedule_cache['data'] is not None and time.time() - _league_schedule_cache['fetched_at'] < ttl:
+        return _league_schedule_cache['data']
+    
+    response = _HTTP.get(NBA_SCHEDULE_URL, timeout=10)
+    if response.status_code != 200:
+        return None
+    
+    data = _slim_league_schedule(_json_loads(response.content))
+    
+    # Index games by normalized date once per refresh, so range queries are O(days) lookups.
+    # Each game is flattened to a (home, away) tricode pair so the per-query loops do
+    # no nested dict lookups.
+    games_by_date = defaultdict(list)
+    for game_date in data.get('leagueSchedule', {}).get('gameDates', []):
+        date_str = _api_game_date_str(game_date.get('gameDate', ''))
+        if date_str:
+            games_by_date[date_str].extend(
+                (game.get('homeTeam', {}).get('teamTricode', ''),
+                 game.get('awayTeam', {}).get('teamTricode', ''))
+                for game in game_date.get('games', [])
+            )
+    
+    _league_schedule_cache['data'] = data
+    _league_schedule_cache['by_date'] = dict(games_by_date)
+    _league_schedule_cache['validators'] = _response_validators(response.headers)
+    _league_schedule_cache['fetched_at'] = time.time()
+    return data
+
+
+def _slim_league_schedule(data: Dict) -> Dict:
+    """
+    Project scheduleLeagueV2.json down to the leaves the schedule code reads (game date,
+    tricodes, UTC tip-off), keeping the same nesting so callers walk it unchanged.
+    The rest of the multi-MB document is released right after decoding.
+    
+    Tricodes are interned: the ~2,500 copies collapse onto the same 30 objects as the
+    module's string literals, so every dict keyed by them hits on pointer equality.
+    """
+    return {'leagueSchedule': {'gameDates': [
+        {
+            'gameDate': game_date.get('gameDate', ''),
+            'games': [
+                {
+                    'homeTeam': {'teamTricode': sys.intern(game.get('homeTeam', {}).get('teamTricode', ''))},
+                    'awayTeam': {'teamTricode': sys.intern(game.get('awayTeam', {}).get('teamTricode', ''))},
+                    'gameDateTimeUTC': game.get('gameDateTimeUTC', ''),
+                }
+                for game in game_date.get('games', [])
+            ],
+        }
+        for game_date in data.get('leagueSchedule', {}).get('gameDates', [])
+    ]}}
+
+
+def _get_league_games_by_date() -> Optional[Dict[str, List[Tuple[str, str]]]]:
+    """League schedule (home, away) pairs indexed by 'YYYY-MM-DD' (API date). None if unavailable."""
+    if _get_league_schedule() is None:
+        return None
+    return _league_schedule_cache['by_date']
+
+
+def _date_range_strs(start: datetime, end: datetime) -> List[str]:
+    """'YYYY-MM-DD' strings for every day from start to end (inclusive)."""
+    return [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end - start).days + 1)]
+
+
+# NBA API gameDate: "MM/DD/YYYY 00:00:00" or "YYYY-MM-DD..."
+_API_DATE_RE = re.compile(r'(?:(\d{1,2})/(\d{1,2})/(\d{4})|(\d{4}-\d{2}-\d{2}))')
+
+
+def _api_game_date_str(raw_date: str) -> Optional[str]:
+    """
+    Normalize an NBA API gameDate to 'YYYY-MM-DD'.
+    The API returns various formats like "MM/DD/YYYY 00:00:00" or "YYYY-MM-DD".
+    """
+    match = _API_DATE_RE.match(raw_date)
+    if not match:
+        return None
+    month, day, year, iso_date = match.groups()
+    # MM/DD/YYYY (NBA API format) is reassembled from the groups; YYYY-MM-DD passes through
+    return iso_date or f"{year}-{int(month):02d}-{int(day):02d}"
+
+
 class NBASchedule:
     """Fetch and manage NBA schedule data"""
     
@@ -556,7 +937,7 @@ class NBASchedule:
         start, end = self.get_week_dates(week_start)
         
         # Normalize team abbreviation
-        team_abbr = self._normalize_team_abbr(team_abbr)
+        team_abbr = _normalize_team_abbr(team_abbr)
         
         # Get schedule from NBA API
         games = self._fetch_team_schedule(team_abbr, start, end)
@@ -588,96 +969,53 @@ class NBASchedule:
     
     def _normalize_team_abbr(self, abbr: str) -> str:
         """Normalize team abbreviation"""
-        abbr = abbr.upper().strip()
-        
-        # Handle common variations
-        variations = {
-            'GS': 'GSW',
-            'NO': 'NOP',
-            'NY': 'NYK',
-            'PHX': 'PHO',
-            'SA': 'SAS',
-        }
-        
-        return variations.get(abbr, abbr)
+        return _normalize_team_abbr(abbr)
     
     def _fetch_team_schedule(self, team_abbr: str, start: datetime, end: datetime) -> List[Dict]:
         """Fetch schedule for a specific team from NBA API"""
         try:
-            # Use NBA Stats API
-            url = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
-            
-            response = requests.get(url, timeout=10)
-            if response.status_code != 200:
+            # Use NBA Stats API (parsed and indexed by date once, shared across team queries)
+            games_by_date = _get_league_games_by_date()
+            if games_by_date is None:
                 return self._get_fallback_games(team_abbr, start, end)
             
-            data = response.json()
             games = []
             
-            # Parse the schedule
-            game_dates = data.get('leagueSchedule', {}).get('gameDates', [])
-            
-            for game_date in game_dates:
-                date_str = game_date.get('gameDate', '')
-                try:
-                    game_dt = datetime.strptime(date_str[:10], '%Y-%m-%d')
-                except:
-                    continue
-                
-                if start <= game_dt <= end:
-                    for game in game_date.get('games', []):
-                        home_team = game.get('homeTeam', {}).get('teamTricode', '')
-                        away_team = game.get('awayTeam', {}).get('teamTricode', '')
-                        
-                        if team_abbr in [home_team, away_team]:
-                            games.append({
-                                'date': date_str[:10],
-                                'home_team': home_team,
-                                'away_team': away_team,
-                                'is_home': team_abbr == home_team
-                            })
+            for date_str in _date_range_strs(start, end):
+                for home_team, away_team in games_by_date.get(date_str, ()):
+                    if team_abbr in (home_team, away_team):
+                        games.append({
+                            'date': date_str,
+                            'home_team': home_team,
+                            'away_team': away_team,
+                            'is_home': team_abbr == home_team
+                        })
             
             return games
             
         except Exception as e:
-            print(f"Error fetching NBA schedule: {e}")
+            logger.warning("Error fetching NBA schedule: %s", e)
             return self._get_fallback_games(team_abbr, start, end)
     
     def _fetch_weekly_schedule(self, start: datetime, end: datetime) -> Dict[str, int]:
         """Fetch games count for all teams in a week"""
-        games_count = defaultdict(int)
-        
         try:
-            url = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
-            
-            response = requests.get(url, timeout=10)
-            if response.status_code != 200:
+            games_by_date = _get_league_games_by_date()
+            if games_by_date is None:
                 return self._get_fallback_weekly_games(start, end)
             
-            data = response.json()
-            game_dates = data.get('leagueSchedule', {}).get('gameDates', [])
-            
-            for game_date in game_dates:
-                date_str = game_date.get('gameDate', '')
-                try:
-                    game_dt = datetime.strptime(date_str[:10], '%Y-%m-%d')
-                except:
-                    continue
-                
-                if start <= game_dt <= end:
-                    for game in game_date.get('games', []):
-                        home_team = game.get('homeTeam', {}).get('teamTricode', '')
-                        away_team = game.get('awayTeam', {}).get('teamTricode', '')
-                        
-                        if home_team:
-                            games_count[home_team] += 1
-                        if away_team:
-                            games_count[away_team] += 1
-            
+            # Counter consumes the flattened team stream in C
+            games_count = Counter(
+                team
+                for date_str in _date_range_strs(start, end)
+                for matchup in games_by_date.get(date_str, ())
+                for team in matchup
+                if team
+            )
             return dict(games_count)
             
         except Exception as e:
-            print(f"Error fetching weekly schedule: {e}")
+            logger.warning("Error fetching weekly schedule: %s", e)
             return self._get_fallback_weekly_games(start, end)
     
     def _get_fallback_games(self, team_abbr: str, start: datetime, end: datetime) -> List[Dict]:
@@ -690,29 +1028,27 @@ class NBASchedule:
     
     def _get_fallback_weekly_games(self, start: datetime, end: datetime) -> Dict[str, int]:
         """Fallback: estimate games for all teams"""
-        # Default to 3-4 games per team per week
-        games_count = {}
-        for abbr in set(NBA_TEAMS.keys()):
-            if len(abbr) == 3:  # Only use standard 3-letter codes
-                games_count[abbr] = 4  # Conservative estimate
-        return games_count
+        # Default to 3-4 games per team per week - conservative estimate of 4
+        return dict.fromkeys(_STANDARD_TEAMS, 4)
     
     def save_cache(self):
-        """Save schedule cache to file"""
+        """Save schedule cache to file (gzip - repeated team keys compress ~10x)"""
         try:
-            with open(CACHE_FILE, 'w') as f:
-                json.dump(self.schedule_cache, f)
+            with gzip.open(CACHE_FILE_GZ, 'wb') as f:
+                f.write(_json_dumps(self.schedule_cache))
         except:
             pass
     
     def load_cache(self):
-        """Load schedule cache from file"""
-        if os.path.exists(CACHE_FILE):
-            try:
-                with open(CACHE_FILE, 'r') as f:
-                    self.schedule_cache = json.load(f)
-            except:
-                self.schedule_cache = {}
+        """Load schedule cache from file (gzip first, then legacy plain JSON)"""
+        for path, opener in ((CACHE_FILE_GZ, gzip.open), (CACHE_FILE, open)):
+            if os.path.exists(path):
+                try:
+                    with opener(path, 'rb') as f:
+                        self.schedule_cache = _json_loads(f.read())
+                    return
+                except:
+                    self.schedule_cache = {}
 
 
 # Singleton instance
@@ -726,26 +1062,15 @@ def get_team_games_this_week(team_abbr: str) -> int:
     then falls back to API or default.
     """
     # Normalize team abbreviation
-    team_abbr = schedule._normalize_team_abbr(team_abbr)
+    team_abbr = _normalize_team_abbr(team_abbr)
     
     # Get current week start (Pacific Time - Monday)
-    today_pacific = get_pacific_time()
-    days_since_monday = today_pacific.weekday()  # Monday = 0
-    week_start = today_pacific - timedelta(days=days_since_monday)
-    week_start_str = week_start.strftime('%Y-%m-%d')
+    week_start_str = _current_week_start_str(int(time.time()) // 60)
     
     # Check hardcoded weekly games first
-    if week_start_str in WEEKLY_GAMES:
-        weekly_data = WEEKLY_GAMES[week_start_str]
-        if team_abbr in weekly_data:
-            return weekly_data[team_abbr]
-        # Try alternate abbreviations
-        alt_abbrs = {'GSW': 'GS', 'NOP': 'NO', 'NYK': 'NY', 'PHO': 'PHX', 'SAS': 'SA'}
-        for main, alt in alt_abbrs.items():
-            if team_abbr == main and alt in weekly_data:
-                return weekly_data[alt]
-            if team_abbr == alt and main in weekly_data:
-                return weekly_data[main]
+    week_games = _WEEKLY_GAMES_CANONICAL.get(week_start_str, {})
+    if team_abbr in week_games:
+        return week_games[team_abbr]
     
     # Fallback to API
     try:
@@ -771,7 +1096,7 @@ def _update_hardcoded_schedule(date_str: str, teams: List[str]):
         date_str: Date in format 'YYYY-MM-DD'
         teams: List of team abbreviations playing on that date
     """
-    global HARDCODED_SCHEDULE
+    global HARDCODED_SCHEDULE, HARDCODED_BY_TEAM
     
     # Check if this date is new or different from existing
     if date_str in HARDCODED_SCHEDULE:
@@ -782,6 +1107,7 @@ def _update_hardcoded_schedule(date_str: str, teams: List[str]):
     
     # Update in-memory cache
     HARDCODED_SCHEDULE[date_str] = teams
+    HARDCODED_BY_TEAM = _build_team_dates_index(HARDCODED_SCHEDULE)
     
     try:
         # Read the current file
@@ -797,7 +1123,7 @@ def _update_hardcoded_schedule(date_str: str, teams: List[str]):
         end_idx = content.find(end_marker, start_idx)
         
         if start_idx == -1 or end_idx == -1:
-            debug_print(f"[DEBUG] Could not find HARDCODED_SCHEDULE boundaries in file")
+            logger.debug("[DEBUG] Could not find HARDCODED_SCHEDULE boundaries in file")
             return
         
         # Extract existing schedule
@@ -825,10 +1151,10 @@ def _update_hardcoded_schedule(date_str: str, teams: List[str]):
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(new_content)
         
-        debug_print(f"[DEBUG] ✅ Auto-updated HARDCODED_SCHEDULE for {date_str}")
+        logger.debug("[DEBUG] ✅ Auto-updated HARDCODED_SCHEDULE for %s", date_str)
         
     except Exception as e:
-        debug_print(f"[DEBUG] Error auto-updating HARDCODED_SCHEDULE: {e}")
+        logger.debug("[DEBUG] Error auto-updating HARDCODED_SCHEDULE: %s", e)
 
 
 def get_teams_playing_on_date(date: datetime) -> Tuple[List[str], bool]:
@@ -843,95 +1169,127 @@ def get_teams_playing_on_date(date: datetime) -> Tuple[List[str], bool]:
     1. Hashtag Basketball (LIVE, most accurate - matches Yahoo's data)
     2. NBA Official API (backup)
     3. HARDCODED_SCHEDULE (emergency fallback)
+    
+    Live results are memoized per date until the scraped schedule is refreshed
+    (or the day rolls over), so per-roster-slot calls are O(1) after the first.
+    Fallback answers are never memoized. The returned list is the caller's own copy.
     """
+    global _teams_on_date_memo
     target_date = date.strftime('%Y-%m-%d')
     
+    # Make sure the scraped schedule (and its version) is current before the memo lookup
+    _refresh_schedule_sources()
+    memo_key = (_hashtag_cache_version, datetime.now().strftime('%Y-%m-%d'))
+    valid_for, memo = _teams_on_date_memo
+    if valid_for != memo_key:
+        memo = {}
+        _teams_on_date_memo = (memo_key, memo)
+    
+    teams = memo.get(target_date)
+    if teams is not None:
+        return list(teams), True
+    
+    teams, has_data, is_live = _lookup_teams_playing_on_date(target_date)
+    # Only live answers are memoized; fallbacks are re-checked so a recovered source is picked up
+    if is_live:
+        memo[target_date] = tuple(teams)
+    return teams, has_data
+
+
+def _refresh_schedule_sources():
+    """
+    Bring the scraped schedule up to date. On a cold start (nothing scraped yet, so the
+    scrape blocks) with the league JSON also expired, download both at once so the
+    miss costs one round-trip, not two.
+    """
+    league_fresh = (_league_schedule_cache['data'] is not None and
+                    time.time() - _league_schedule_cache['fetched_at'] < LEAGUE_SCHEDULE_TTL_SECONDS)
+    if _hashtag_schedule_cache or league_fresh or not _hashtag_scrape_due():
+        # A stale scraped schedule is served at once and refreshed in the background;
+        # a cold scrape inside its retry back-off returns at once as well
+        fetch_schedule_from_hashtagbasketball()
+        return
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(fetch_schedule_from_hashtagbasketball),
+                   executor.submit(_get_league_schedule)]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.debug("[DEBUG] Schedule prefetch error: %s", e)
+
+
+def _lookup_teams_playing_on_date(target_date: str) -> Tuple[List[str], bool, bool]:
+    """Body of get_teams_playing_on_date: (teams, has_data, came from a live source).
+    
+    Reads the scraped schedule as left by _refresh_schedule_sources() rather than
+    fetching it again. The returned list is the caller's own copy.
+    """
     # First, check Hashtag Basketball (most accurate, matches Yahoo)
-    hashtag_schedule = fetch_schedule_from_hashtagbasketball()
-    if target_date in hashtag_schedule:
-        teams = hashtag_schedule[target_date]
-        debug_print(f"[DEBUG] Using Hashtag Basketball schedule for {target_date}: {len(teams)} teams")
+    if target_date in _hashtag_schedule_cache:
+        teams = list(_hashtag_schedule_cache[target_date])
+        logger.debug("[DEBUG] Using Hashtag Basketball schedule for %s: %s teams", target_date, len(teams))
         # Auto-update HARDCODED_SCHEDULE with live data
-        _update_hardcoded_schedule(target_date, teams)
-        return teams, True  # We have reliable data
+        _update_hardcoded_schedule(target_date, list(teams))
+        return teams, True, True  # We have reliable data
     
     # Second, try NBA Official API
     try:
-        url = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            game_dates = data.get('leagueSchedule', {}).get('gameDates', [])
-            
-            teams_playing = []
-            
-            for game_date in game_dates:
-                date_str = game_date.get('gameDate', '')[:10]
-                
-                if date_str == target_date:
-                    for game in game_date.get('games', []):
-                        home_team = game.get('homeTeam', {}).get('teamTricode', '')
-                        away_team = game.get('awayTeam', {}).get('teamTricode', '')
-                        
-                        if home_team and home_team not in teams_playing:
-                            teams_playing.append(home_team)
-                        if away_team and away_team not in teams_playing:
-                            teams_playing.append(away_team)
-                    break
+        games_by_date = _get_league_games_by_date()
+        
+        # O(1) probe of the date index; a date present with no games still counts as data
+        if games_by_date is not None and target_date in games_by_date:
+            # Insertion-ordered set: O(1) dedup, same order as the old list
+            teams_playing = list(dict.fromkeys(
+                team for matchup in games_by_date[target_date] for team in matchup if team
+            ))
             
-            if teams_playing or date_str == target_date:
-                # If we found the date in NBA API (even if no games), we have data
-                debug_print(f"[DEBUG] Using NBA Official API for {target_date}: {len(teams_playing)} teams")
-                # Auto-update HARDCODED_SCHEDULE with live data
-                _update_hardcoded_schedule(target_date, teams_playing)
-                return teams_playing, True
+            logger.debug("[DEBUG] Using NBA Official API for %s: %s teams", target_date, len(teams_playing))
+            # Auto-update HARDCODED_SCHEDULE with live data
+            _update_hardcoded_schedule(target_date, list(teams_playing))
+            return teams_playing, True, True
         
     except Exception as e:
-        debug_print(f"[DEBUG] NBA API error for {target_date}: {e}")
+        logger.debug("[DEBUG] NBA API error for %s: %s", target_date, e)
     
     # Third, fallback to hardcoded schedule (emergency only)
     if target_date in HARDCODED_SCHEDULE:
-        teams = HARDCODED_SCHEDULE[target_date]
-        debug_print(f"[DEBUG] Using HARDCODED schedule (fallback) for {target_date}: {len(teams)} teams")
-        return teams, True  # We have reliable data
+        teams = list(HARDCODED_SCHEDULE[target_date])
+        logger.debug("[DEBUG] Using HARDCODED schedule (fallback) for %s: %s teams", target_date, len(teams))
+        return teams, True, False  # We have reliable data
     
     # No data available for this date
-    debug_print(f"[DEBUG] No game data found for {target_date}")
-    return [], False  # We don't have reliable data
+    logger.debug("[DEBUG] No game data found for %s", target_date)
+    return [], False, False  # We don't have reliable data
 
 
 def get_team_games_remaining_this_week(team_abbr: str) -> int:
     """Get number of games remaining this week for a team (from today onwards)"""
-    try:
-        # Get the current week's end date (Monday) in Pacific Time
-        _, week_end = get_week_dates_range()
-        today = get_pacific_time()
-        
-        # Normalize team abbreviation
-        team_abbr = schedule._normalize_team_abbr(team_abbr)
-        
-        games = schedule._fetch_team_schedule(team_abbr, today, week_end)
-        
-        # Filter games from today onwards
-        remaining = 0
-        today_str = today.strftime('%Y-%m-%d')
-        
-        for game in games:
-            game_date = game.get('date', '')
-            if game_date >= today_str or game.get('estimated'):
-                remaining += 1
-        
-        return remaining if remaining > 0 else 1  # At least 1 remaining
-        
-    except:
+    # Get the current week's end date (Sunday) in Pacific Time
+    _, week_end = get_week_dates_range()
+    today_str = get_pacific_time().strftime('%Y-%m-%d')
+    
+    # Bisect the team's sorted game dates in the shared full-schedule index
+    team_entry = _get_team_index(_fetch_and_cache_full_schedule()).get(_normalize_team_abbr(team_abbr))
+    if not team_entry:
         return 2  # Default estimate
+    
+    team_dates = team_entry[0]
+    remaining = bisect_right(team_dates, week_end.strftime('%Y-%m-%d')) - bisect_left(team_dates, today_str)
+    return max(1, remaining)  # At least 1 remaining
 
 
 def get_week_dates_range() -> Tuple[datetime, datetime]:
     """Get the start (Monday) and end (Sunday) dates for the current fantasy week (Pacific Time)"""
+    return _week_dates_range_for_minute(int(time.time()) // 60)
+
+
+@lru_cache(maxsize=1)
+def _week_dates_range_for_minute(minute_key: int) -> Tuple[datetime, datetime]:
+    """Current week's boundaries computed once per wall-clock minute (see get_week_dates_range)."""
     # Use Pacific Time for week boundaries (Monday to Sunday)
-    today_pacific = get_pacific_time()
+    today_pacific = _pacific_time_for_minute(minute_key)
     # Week starts on Monday
     days_since_monday = today_pacific.weekday()  # Monday = 0
     week_start = today_pacific - timedelta(days=days_since_monday)
@@ -941,109 +1299,64 @@ def get_week_dates_range() -> Tuple[datetime, datetime]:
            week_end.replace(hour=23, minute=59, second=59, microsecond=0)
 
 
-def get_todays_games() -> Dict[str, Dict]:
+def _todays_schedule_dates() -> Tuple[str, Tuple[str, str]]:
+    """
+    Today's date string and the Pacific dates whose games can fall on it in Israel time
+    (late evening US = next day Israel, so yesterday's and today's).
+    """
+    today = datetime.now()
+    today_str = today.strftime('%Y-%m-%d')
+    return today_str, ((today - timedelta(days=1)).strftime('%Y-%m-%d'), today_str)
+
+
+def get_todays_games() -> Mapping[str, Dict]:
     """
     Get all games happening today with details.
-    Returns dict: team_abbr -> {opponent, time_israel, is_home, game_time_utc}
+    Returns a read-only mapping: team_abbr -> {opponent, time_israel, is_home, game_time_utc}
     
-    Uses caching - only fetches from API once per day.
+    A slice of the cached full schedule (no separate API call); memoized per day and
+    returned as a view of the memo, not a copy.
     """
     global _todays_games_cache, _todays_games_date
     
-    # Load from disk if not loaded yet
-    _load_schedule_cache_from_disk()
+    today_str, schedule_dates = _todays_schedule_dates()
     
-    today = datetime.now()
-    today_str = today.strftime('%Y-%m-%d')
+    # Check if we have cached data for today (an empty slate is cached too)
+    if _todays_games_date == today_str:
+        logger.debug("[NBA Schedule] Using cached today's games (%s teams)", len(_todays_games_cache))
+        return MappingProxyType(_todays_games_cache)
     
-    # Check if we have cached data for today
-    if _todays_games_date == today_str and _todays_games_cache:
-        debug_print(f"[NBA Schedule] Using cached today's games ({len(_todays_games_cache)} teams)")
-        return _todays_games_cache
+    full_schedule = _fetch_and_cache_full_schedule()
+    if not full_schedule:
+        return MappingProxyType(_todays_games_cache)
     
-    debug_print(f"[NBA Schedule] Fetching today's games from NBA API...")
+    games_today = {
+        team: game_info
+        for date_str in schedule_dates
+        for team, game_info in full_schedule.get(date_str, {}).items()
+        if game_info.get('israel_date') == today_str
+    }
     
-    try:
-        url = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code != 200:
-            return _todays_games_cache or {}
-        
-        data = response.json()
-        game_dates = data.get('leagueSchedule', {}).get('gameDates', [])
-        
-        today = datetime.now()
-        today_str = today.strftime('%Y-%m-%d')
-        
-        games_today = {}
-        
-        for game_date in game_dates:
-            date_str = game_date.get('gameDate', '')[:10]
-            
-            # Check both API date and the day before (in case game is late evening US = next day Israel)
-            check_dates = [today_str]
-            yesterday = today - timedelta(days=1)
-            check_dates.append(yesterday.strftime('%Y-%m-%d'))
-            
-            if date_str in check_dates:
-                for game in game_date.get('games', []):
-                    home_team = game.get('homeTeam', {}).get('teamTricode', '')
-                    away_team = game.get('awayTeam', {}).get('teamTricode', '')
-                    game_time_utc = game.get('gameDateTimeUTC', '')
-                    
-                    # Convert UTC time to Israel time AND check if it's actually today
-                    israel_time = None
-                    israel_date_matches_today = False
-                    if game_time_utc:
-                        try:
-                            # Parse UTC time
-                            utc_dt = datetime.strptime(game_time_utc, '%Y-%m-%dT%H:%M:%SZ')
-                            # Israel is UTC+2 (winter) or UTC+3 (summer/DST)
-                            israel_offset = 2
-                            if 3 <= today.month <= 10:  # Approximate DST period
-                                israel_offset = 3
-                            israel_dt = utc_dt + timedelta(hours=israel_offset)
-                            israel_time = israel_dt.strftime('%H:%M')
-                            # Check if this game is actually TODAY in Israel time
-                            israel_date_matches_today = (israel_dt.date() == today.date())
-                        except:
-                            israel_time = None
-                            israel_date_matches_today = False
-                    
-                    # Only add if game is actually today in Israel time
-                    if israel_date_matches_today:
-                        # Add home team's game
-                        if home_team:
-                            games_today[home_team] = {
-                                'opponent': away_team,
-                                'time_israel': israel_time,
-                                'is_home': True,
-                                'game_time_utc': game_time_utc
-                            }
-                        
-                        # Add away team's game
-                        if away_team:
-                            games_today[away_team] = {
-                                'opponent': home_team,
-                                'time_israel': israel_time,
-                                'is_home': False,
-                                'game_time_utc': game_time_utc
-                            }
-        
-        # Cache the results
-        _todays_games_cache = games_today
-        _todays_games_date = today_str
-        debug_print(f"[NBA Schedule] Cached {len(games_today)} teams for today")
-        
-        # Save to disk
-        _save_schedule_cache_to_disk()
-        
-        return games_today
-        
-    except Exception as e:
-        print(f"Error getting today's games: {e}")
-        return _todays_games_cache or {}
+    # Cache the results
+    _todays_games_cache = games_today
+    _todays_games_date = today_str
+    logger.debug("[NBA Schedule] Cached %s teams for today", len(games_today))
+    
+    return MappingProxyType(games_today)
+
+
+def _today_for_team(team_abbr: str) -> Optional[Dict]:
+    """Today's game for one (canonical) team, probing the full schedule without building all of today."""
+    today_str, schedule_dates = _todays_schedule_dates()
+    if _todays_games_date == today_str:
+        return _todays_games_cache.get(team_abbr)
+    
+    full_schedule = _fetch_and_cache_full_schedule()
+    for date_str in schedule_dates:
+        game_info = full_schedule.get(date_str, {}).get(team_abbr)
+        if game_info and game_info.get('israel_date') == today_str:
+            return game_info
+    return None
 
 
 def get_team_game_today(team_abbr: str) -> Optional[Dict]:
@@ -1051,17 +1364,34 @@ def get_team_game_today(team_abbr: str) -> Optional[Dict]:
     Get game info for a specific team today.
     Returns None if no game, or dict with: opponent, time_israel, is_home
     """
-    team_abbr = schedule._normalize_team_abbr(team_abbr)
-    games = get_todays_games()
-    return games.get(team_abbr)
+    return _today_for_team(_normalize_team_abbr(team_abbr))
+
+
+def _shift_utc_timestamp(game_time_utc: str, offset_hours: int) -> Tuple[str, str]:
+    """
+    ('YYYY-MM-DD', 'HH:MM') of an API 'YYYY-MM-DDTHH:MM:SSZ' time shifted by offset_hours
+    (|offset_hours| < 24). Fields are sliced out and formatted as integers; only a shift
+    across midnight touches the calendar, via a one-day ordinal step.
+    """
+    minute = int(game_time_utc[14:16])
+    hour = int(game_time_utc[11:13]) + offset_hours
+    if 0 <= hour < 24:
+        return game_time_utc[:10], f"{hour:02d}:{minute:02d}"
+    
+    utc_day = datetime(int(game_time_utc[0:4]), int(game_time_utc[5:7]), int(game_time_utc[8:10]))
+    day = datetime.fromordinal(utc_day.toordinal() + (1 if hour >= 24 else -1))
+    return f"{day.year:04d}-{day.month:02d}-{day.day:02d}", f"{hour % 24:02d}:{minute:02d}"
 
 
 def _fetch_and_cache_full_schedule() -> Dict[str, Dict]:
     """
     Fetch the full NBA schedule and cache it.
     Returns dict: date_str -> {team_abbr -> game_info}
+    
+    This is the single walker over the league schedule; get_todays_games reads
+    its slice of today from here (each entry carries its Israel date).
     """
-    global _weekly_schedule_cache, _weekly_schedule_timestamp
+    global _weekly_schedule_cache, _weekly_schedule_timestamp, _weekly_schedule_validators
     
     # Load from disk if not loaded yet
     _load_schedule_cache_from_disk()
@@ -1072,108 +1402,120 @@ def _fetch_and_cache_full_schedule() -> Dict[str, Dict]:
     if _weekly_schedule_timestamp:
         age_hours = (now - _weekly_schedule_timestamp).total_seconds() / 3600
         if age_hours < WEEKLY_CACHE_TTL_HOURS and _weekly_schedule_cache:
-            debug_print(f"[NBA Schedule] Using cached schedule ({len(_weekly_schedule_cache)} dates, {age_hours:.1f}h old)")
+            logger.debug("[NBA Schedule] Using cached schedule (%s dates, %.1fh old)", len(_weekly_schedule_cache), age_hours)
             return _weekly_schedule_cache
     
-    debug_print("[NBA Schedule] Fetching full schedule from NBA API...")
+    # Expired but unchanged upstream - keep the cached copy and restart the TTL
+    if _weekly_schedule_cache and _schedule_not_modified(_weekly_schedule_validators):
+        logger.debug("[NBA Schedule] Schedule not modified (304), reusing cached schedule")
+        _weekly_schedule_timestamp = now
+        _save_in_background(_save_schedule_cache_to_disk)
+        return _weekly_schedule_cache
+    
+    logger.debug("[NBA Schedule] Fetching full schedule from NBA API...")
     
     try:
-        url = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
-        response = requests.get(url, timeout=10)
+        data = _get_league_schedule()
         
-        if response.status_code != 200:
+        if data is None:
             return _weekly_schedule_cache or {}
         
-        data = response.json()
+        validators = _league_schedule_cache['validators']
         game_dates = data.get('leagueSchedule', {}).get('gameDates', [])
         
         schedule_data = {}
         
+        # PST = UTC-8 (Winter), PDT = UTC-7 (Summer); Israel is UTC+2 / UTC+3
+        is_dst = 3 <= now.month <= 10
+        pacific_offset = -7 if is_dst else -8
+        israel_offset = 3 if is_dst else 2
+        
         for game_date in game_dates:
-            raw_date = game_date.get('gameDate', '')
-            
             # Parse date - NBA API returns various formats like "MM/DD/YYYY" or "YYYY-MM-DD"
-            date_str = None
-            try:
-                # Try MM/DD/YYYY format first (NBA API format)
-                if '/' in raw_date:
-                    parsed = datetime.strptime(raw_date.split(' ')[0], '%m/%d/%Y')
-                    date_str = parsed.strftime('%Y-%m-%d')
-                # Try YYYY-MM-DD format
-                elif '-' in raw_date:
-                    date_str = raw_date[:10]
-                else:
-                    continue
-            except:
-                continue
+            date_str = _api_game_date_str(game_date.get('gameDate', ''))
             
             if not date_str:
                 continue
                 
-            if date_str not in schedule_data:
-                schedule_data[date_str] = {}
+            schedule_data.setdefault(date_str, {})
             
             for game in game_date.get('games', []):
-                home_team = game.get('homeTeam', {}).get('teamTricode', '')
-                away_team = game.get('awayTeam', {}).get('teamTricode', '')
+                # Canonical abbreviations (e.g. PHX -> PHO), so readers never need alias lookups
+                home_team = _canon_abbr(game.get('homeTeam', {}).get('teamTricode', ''))
+                away_team = _canon_abbr(game.get('awayTeam', {}).get('teamTricode', ''))
                 game_time_utc = game.get('gameDateTimeUTC', '')
                 
                 # Convert UTC time to both Pacific Time (for date) and Israel Time (for display)
                 israel_time = None
+                israel_date_str = None
                 pacific_date_str = date_str  # Default to API date
                 
                 if game_time_utc:
                     try:
-                        utc_dt = datetime.strptime(game_time_utc, '%Y-%m-%dT%H:%M:%SZ')
-                        
-                        # Convert to Pacific Time to determine the game date (Yahoo's logic)
-                        # PST = UTC-8 (Winter), PDT = UTC-7 (Summer)
-                        is_dst = 3 <= now.month <= 10
-                        pacific_offset = -7 if is_dst else -8
-                        pacific_dt = utc_dt + timedelta(hours=pacific_offset)
-                        pacific_date_str = pacific_dt.strftime('%Y-%m-%d')
-                        
-                        # Convert to Israel Time for display
-                        israel_offset = 3 if is_dst else 2
-                        israel_dt = utc_dt + timedelta(hours=israel_offset)
-                        israel_time = israel_dt.strftime('%H:%M')
+                        # Pacific Time determines the game date (Yahoo's logic),
+                        # Israel Time is for display
+                        pacific_date_str, _ = _shift_utc_timestamp(game_time_utc, pacific_offset)
+                        israel_date_str, israel_time = _shift_utc_timestamp(game_time_utc, israel_offset)
                     except:
                         pass
                 
-                # Ensure the date key exists (using Pacific date as key)
-                if pacific_date_str not in schedule_data:
-                    schedule_data[pacific_date_str] = {}
+                # Ensure the date key exists (using Pacific date as key), looked up once per game
+                day_games = schedule_data.setdefault(pacific_date_str, {})
                 
                 # Add home team's game (keyed by Pacific date, showing Israel time)
                 if home_team:
-                    schedule_data[pacific_date_str][home_team] = {
+                    day_games[home_team] = {
                         'opponent': away_team,
                         'time_israel': israel_time,
-                        'is_home': True
+                        'is_home': True,
+                        'israel_date': israel_date_str,
+                        'game_time_utc': game_time_utc
                     }
                 
                 # Add away team's game (keyed by Pacific date, showing Israel time)
                 if away_team:
-                    schedule_data[pacific_date_str][away_team] = {
+                    day_games[away_team] = {
                         'opponent': home_team,
                         'time_israel': israel_time,
-                        'is_home': False
+                        'is_home': False,
+                        'israel_date': israel_date_str,
+                        'game_time_utc': game_time_utc
                     }
         
         _weekly_schedule_cache = schedule_data
         _weekly_schedule_timestamp = now
-        debug_print(f"[NBA Schedule] Cached schedule for {len(schedule_data)} dates")
+        _weekly_schedule_validators = validators
+        logger.debug("[NBA Schedule] Cached schedule for %s dates", len(schedule_data))
         
         # Save to disk
-        _save_schedule_cache_to_disk()
+        _save_in_background(_save_schedule_cache_to_disk)
         
         return schedule_data
         
     except Exception as e:
-        debug_print(f"[NBA Schedule] Error fetching schedule: {e}")
+        logger.debug("[NBA Schedule] Error fetching schedule: %s", e)
         return _weekly_schedule_cache or {}
 
 
+def _get_team_index(full_schedule: Dict[str, Dict]) -> Dict[str, Tuple[List[str], List[Dict]]]:
+    """
+    Inverted index of the full schedule: canonical team abbr -> (sorted date_strs, game_infos).
+    Rebuilt only when the cached schedule object is replaced.
+    """
+    global _team_index, _team_index_source
+    
+    if full_schedule is not _team_index_source:
+        index = defaultdict(lambda: ([], []))
+        for date_str in sorted(full_schedule):
+            for team, game_info in full_schedule[date_str].items():
+                dates, games = index[_canon_abbr(team)]
+                dates.append(date_str)
+                games.append(game_info)
+        _team_index = dict(index)
+        _team_index_source = full_schedule
+    return _team_index
+
+
 def get_full_nba_schedule() -> Dict[str, Dict]:
     """
     Get the full NBA schedule from NBA Official API.
@@ -1197,7 +1539,7 @@ def get_team_weekly_schedule(team_abbr: str, week_start: datetime = None, week_e
     When week_end is provided, supports double weeks (e.g. 14 days for All-Star week).
     Uses cached full schedule to avoid repeated API calls.
     """
-    team_abbr = schedule._normalize_team_abbr(team_abbr)
+    team_abbr = _normalize_team_abbr(team_abbr)
     
     # Get week dates (Pacific Time - Monday to Sunday, or custom range for double weeks)
     if week_start is None:
@@ -1214,71 +1556,60 @@ def get_team_weekly_schedule(team_abbr: str, week_start: datetime = None, week_e
     # Hebrew day names (Monday to Sunday) - cycle for double weeks
     hebrew_days = ['שני', 'שלישי', 'רביעי', 'חמישי', 'שישי', 'שבת', 'ראשון']
     
+    # Use Pacific Time to match Yahoo Fantasy's timezone (computed once, not per day)
+    pacific_date = get_pacific_date().date()
+    
     # Get cached full schedule (single API call for all teams)
     full_schedule = _fetch_and_cache_full_schedule()
     
-    # Extract games for this team from the cached schedule
-    games_by_date = {}
-    current_day = week_start
-    while current_day <= week_end:
-        date_str = current_day.strftime('%Y-%m-%d')
-        date_games = full_schedule.get(date_str, {})
-        
-        # Try team abbreviation and alternatives
-        game_info = date_games.get(team_abbr)
-        if not game_info:
-            alt_abbrs = {'GSW': 'GS', 'NOP': 'NO', 'NYK': 'NY', 'PHO': 'PHX', 'SAS': 'SA'}
-            for main, alt in alt_abbrs.items():
-                if team_abbr == main:
-                    game_info = date_games.get(alt)
-                    break
-                elif team_abbr == alt:
-                    game_info = date_games.get(main)
-                    break
-        
-        if game_info:
-            games_by_date[date_str] = game_info
-        
-        current_day += timedelta(days=1)
+    # Every day in range, computed once and shared by the lookups and the builder below
+    num_days = (week_end - week_start).days + 1
+    day_dates = [(week_start + timedelta(days=i)).date() for i in range(num_days)]
+    date_strs = [d.strftime('%Y-%m-%d') for d in day_dates]
+    # Day labels cycle for double weeks, e.g. "שני (2)" for second Monday
+    day_names = [
+        hebrew_days[i % 7] if i < 7 else f"{hebrew_days[i % 7]} ({i // 7 + 1})"
+        for i in range(num_days)
+    ]
+    
+    # Extract games for this team from the cached schedule: bisect the team's sorted dates
+    team_dates, team_games = _get_team_index(full_schedule).get(team_abbr, ((), ()))
+    lo = bisect_left(team_dates, date_strs[0])
+    hi = bisect_right(team_dates, date_strs[-1])
+    games_by_date = dict(zip(team_dates[lo:hi], team_games[lo:hi]))
     
     # Fallback to scraped schedule from hashtagbasketball for any dates not found in API
     hashtag_schedule = fetch_schedule_from_hashtagbasketball()
     
-    current_day = week_start
-    while current_day <= week_end:
-        date_str = current_day.strftime('%Y-%m-%d')
-        # If we don't have this date from API, try scraped schedule
-        if date_str not in games_by_date:
-            if date_str in hashtag_schedule:
-                teams_playing = hashtag_schedule[date_str]
-                if team_abbr in teams_playing:
-                    # Try to find opponent by finding which teams are missing from API
-                    opponent = None
-                    date_games = full_schedule.get(date_str, {})
-                    
-
-                    
-                    # Find teams in HARDCODED but missing from API (like our team)
-                    missing_teams = [t for t in teams_playing if t not in date_games]
-                    
-
-                    
-                    # If exactly 2 teams are missing, they play each other!
-                    if len(missing_teams) == 2:
-                        opponent = missing_teams[0] if missing_teams[1] == team_abbr else missing_teams[1]
-                        debug_print(f"[NBA Schedule] Inferred opponent for {team_abbr} on {date_str}: {opponent} (both missing from API)")
-
-                    
-                    # Only add game if we have a valid opponent
-                    if opponent:
-                        games_by_date[date_str] = {
-                            'opponent': opponent,
-                            'time_israel': None,
-                            'is_home': None
-                        }
-                    
-
-        current_day += timedelta(days=1)
+    for date_str in date_strs:
+        # Already have this date from API
+        if date_str in games_by_date:
+            continue
+        
+        teams_playing = hashtag_schedule.get(date_str)
+        if not teams_playing or team_abbr not in teams_playing:
+            continue
+        
+        # Try to find opponent by finding which teams are missing from API
+        opponent = None
+        date_games = full_schedule.get(date_str, {})
+        
+        # Find teams in HARDCODED but missing from API (like our team)
+        # API keys are already canonical; canonicalize the scraped ones to match
+        missing_teams = [t for t in teams_playing if _canon_abbr(t) not in date_games]
+        
+        # If exactly 2 teams are missing, they play each other!
+        if len(missing_teams) == 2:
+            opponent = missing_teams[0] if _canon_abbr(missing_teams[1]) == team_abbr else missing_teams[1]
+            logger.debug("[NBA Schedule] Inferred opponent for %s on %s: %s (both missing from API)", team_abbr, date_str, opponent)
+        
+        # Only add game if we have a valid opponent
+        if opponent:
+            games_by_date[date_str] = {
+                'opponent': opponent,
+                'time_israel': None,
+                'is_home': None
+            }
         
     # Check if we have any games data at all
     total_games_found = len(games_by_date)
@@ -1286,13 +1617,13 @@ def get_team_weekly_schedule(team_abbr: str, week_start: datetime = None, week_e
     # If no games found for this week, use WEEKLY_GAMES as fallback
     if total_games_found == 0:
         week_start_str = week_start.strftime('%Y-%m-%d')
-        if week_start_str in WEEKLY_GAMES:
-            team_games_this_week = WEEKLY_GAMES[week_start_str].get(team_abbr, 4)
-            debug_print(f"[DEBUG] No detailed schedule found for {team_abbr} week {week_start_str}, using WEEKLY_GAMES estimate: {team_games_this_week} games")
+        if week_start_str in _WEEKLY_GAMES_CANONICAL:
+            team_games_this_week = _WEEKLY_GAMES_CANONICAL[week_start_str].get(team_abbr, 4)
+            logger.debug("[DEBUG] No detailed schedule found for %s week %s, using WEEKLY_GAMES estimate: %s games", team_abbr, week_start_str, team_games_this_week)
         else:
             # Default fallback: estimate 4 games per week (typical NBA schedule)
             team_games_this_week = 4
-            debug_print(f"[DEBUG] No schedule data for {team_abbr} week {week_start_str}, using default estimate: {team_games_this_week} games")
+            logger.debug("[DEBUG] No schedule data for %s week %s, using default estimate: %s games", team_abbr, week_start_str, team_games_this_week)
         
         # Distribute games evenly across the week (skip Sunday typically has fewer games)
         # Typical pattern: Mon-Sat with some off days
@@ -1303,68 +1634,41 @@ def get_team_weekly_schedule(team_abbr: str, week_start: datetime = None, week_e
             typical_game_days.append(4)  # Add Friday
         
         # Create estimated schedule (same pattern repeats for double weeks)
+        estimated_flags = []
         games_distributed = 0
-        current_day = week_start
-        while current_day <= week_end:
-            date_str = current_day.strftime('%Y-%m-%d')
-            day_index = (current_day - week_start).days
-            day_of_week = day_index % 7  # 0-6 so pattern repeats for double weeks
-            
-            has_game = (day_of_week in typical_game_days and games_distributed < team_games_this_week)
+        for day_index in range(num_days):
+            has_game = (day_index % 7 in typical_game_days and games_distributed < team_games_this_week)
             if has_game:
                 games_distributed += 1
-            
-            pacific_date = get_pacific_date().date()
-            day_name_idx = day_index % 7  # Cycle for double weeks
-            day_name = hebrew_days[day_name_idx]
-            if day_index >= 7:
-                day_name = f"{day_name} ({day_index // 7 + 1})"  # e.g. "שני (2)" for second Monday
-            
-            weekly_schedule.append({
+            estimated_flags.append(has_game)
+        
+        return [
+            {
                 'date': date_str,
-                'day_name': day_name,
-                'day_short': hebrew_days[day_name_idx][:2] + "'",
+                'day_name': day_names[i],
+                'day_short': hebrew_days[i % 7][:2] + "'",
                 'has_game': has_game,
                 'opponent': '?' if has_game else None,  # Unknown opponent
                 'time_israel': None,
                 'is_home': None,
-                'is_today': current_day.date() == pacific_date,
-                'is_past': current_day.date() < pacific_date
-            })
-            
-            current_day += timedelta(days=1)
-        
-        return weekly_schedule
-    
-    # Build weekly schedule with actual game data
-    weekly_schedule = []
-    current_day = week_start
-    
-    while current_day <= week_end:
-        date_str = current_day.strftime('%Y-%m-%d')
-        day_index = (current_day - week_start).days  # Days since week start (Monday=0)
-        day_name_idx = day_index % 7  # Cycle for double weeks (14 days)
-        day_name = hebrew_days[day_name_idx]
-        if day_index >= 7:
-            day_name = f"{day_name} ({day_index // 7 + 1})"  # e.g. "שני (2)" for second Monday
-        
-        game_info = games_by_date.get(date_str)
-        
-        # Use Pacific Time to match Yahoo Fantasy's timezone
-        pacific_date = get_pacific_date().date()
-        
-        weekly_schedule.append({
+                'is_today': day_dates[i] == pacific_date,
+                'is_past': day_dates[i] < pacific_date
+            }
+            for i, (date_str, has_game) in enumerate(zip(date_strs, estimated_flags))
+        ]
+    
+    # Build weekly schedule with actual game data (fixed-length, one entry per day)
+    return [
+        {
             'date': date_str,
-            'day_name': day_name,
-            'day_short': hebrew_days[day_name_idx][:2] + "'",  # ב', ג', etc.
-            'has_game': game_info is not None,
+            'day_name': day_names[i],
+            'day_short': hebrew_days[i % 7][:2] + "'",  # ב', ג', etc.
+            'has_game': (game_info := games_by_date.get(date_str)) is not None,
             'opponent': game_info.get('opponent') if game_info else None,
             'time_israel': game_info.get('time_israel') if game_info else None,
             'is_home': game_info.get('is_home') if game_info else None,
-            'is_today': current_day.date() == pacific_date,
-            'is_past': current_day.date() < pacific_date
-        })
-        
-        current_day += timedelta(days=1)
-    
-    return weekly_schedule
+            'is_today': day_dates[i] == pacific_date,
+            'is_past': day_dates[i] < pacific_date
+        }
+        for i, date_str in enumerate(date_strs)
+    ]
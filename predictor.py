@@ -2,11 +2,17 @@
 Fantasy Basketball Matchup Predictor
 Predicts weekly matchup results based on player stats, games played, and injuries
 """
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Mapping, Tuple, Optional, Any
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, date
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import chain
 import statistics
+import time
+
+import numpy as np
 
 from yahoo_api import api, STAT_ID_MAP, STAT_NAME_TO_ID
 from config import DEBUG_MODE
@@ -17,8 +23,8 @@ def debug_print(*args, **kwargs):
         print(*args, **kwargs)
 
 # ==================== PREDICTION CACHE ====================
-# Cache for predictions (in-memory)
-_prediction_cache: Dict[str, Dict] = {}
+# Cache for predictions (in-memory): full key -> (data, time.monotonic() expiry)
+_prediction_cache: Dict[str, Tuple[Any, float]] = {}
 PREDICTION_CACHE_TTL = 3600  # 1 hour - predictions don't change much within same week
 
 
@@ -36,10 +42,10 @@ def _get_prediction_cached(key: str) -> Optional[Any]:
     prefix = _prediction_user_prefix()
     full_key = f"{prefix}:{key}" if prefix else key
 
-    if full_key in _prediction_cache:
-        cached = _prediction_cache[full_key]
-        if datetime.now() < cached['expires']:
-            return cached['data']
+    cached = _prediction_cache.get(full_key)
+    if cached is not None:
+        if time.monotonic() < cached[1]:
+            return cached[0]
         else:
             del _prediction_cache[full_key]
     return None
@@ -49,10 +55,7 @@ def _set_prediction_cached(key: str, data: Any):
     """Store prediction in cache with TTL. Auto-prefixed by user GUID."""
     prefix = _prediction_user_prefix()
     full_key = f"{prefix}:{key}" if prefix else key
-    _prediction_cache[full_key] = {
-        'data': data,
-        'expires': datetime.now() + timedelta(seconds=PREDICTION_CACHE_TTL)
-    }
+    _prediction_cache[full_key] = (data, time.monotonic() + PREDICTION_CACHE_TTL)
 from nba_schedule import (
     schedule, get_team_games_this_week, get_teams_playing_on_date,
     get_team_games_remaining_this_week, get_week_dates_range,
@@ -91,6 +94,9 @@ INACTIVE_POSITIONS = ['IL', 'IL+']
 # Maximum daily starters (if more players available, use only starting positions)
 MAX_DAILY_STARTERS = 10
 
+# Shooting totals tracked alongside counting stats for FG%/FT%
+FG_DATA_KEYS = ('fgm', 'fga', 'ftm', 'fta')
+
 # Injury status adjustments (probability multiplier)
 # Based on historical NBA injury tag play rates and fantasy community consensus
 # These percentages represent the likelihood a player will actually play
@@ -117,8 +123,11 @@ INJURY_SKIP = {
     'IL+': 0.0,
 }
 
+# Single status -> factor lookup; skipped statuses win over counted ones
+_INJURY_FACTOR = {**INJURY_COUNT, **INJURY_SKIP}
+
 
-@dataclass
+@dataclass(slots=True)
 class PlayerProjection:
     """Projected stats for a player for the week"""
     player_key: str
@@ -137,7 +146,7 @@ class PlayerProjection:
     weekly_schedule: Optional[List[Dict]] = None  # Full week schedule with daily games
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamProjection:
     """Projected stats for a team for the week"""
     team_key: str
@@ -145,9 +154,14 @@ class TeamProjection:
     players: List[PlayerProjection]
     total_projected: Dict[str, float]
     remaining_games: int = 0  # Games remaining (calculated accurately from active roster)
+    
+    @property
+    def injured(self) -> List[PlayerProjection]:
+        """Players with injury_adjustment < 1.0, read from the current player list."""
+        return [p for p in self.players if p.injury_adjustment < 1.0]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchupPrediction:
     """Complete matchup prediction"""
     week: int
@@ -163,6 +177,8 @@ class MatchupPrediction:
     # Current actual stats (accumulated so far this week)
     actual_my_stats: Optional[Dict[str, float]] = None
     actual_opponent_stats: Optional[Dict[str, float]] = None
+    # Rendered format_prediction_report() text, filled on first render
+    _report: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 
 def get_injury_factor(status: str) -> float:
@@ -173,18 +189,133 @@ def get_injury_factor(status: str) -> float:
     - 0.5 = questionable/GTD (50%)
     - 0.0 = out/doubtful (0%)
     """
-    status = status.strip() if status else ''
+    # Default: count unknown statuses as healthy
+    return _INJURY_FACTOR.get(status.strip() if status else '', 1.0)
+
+
+def _as_float(value: Any, default: Optional[float] = 0.0) -> Optional[float]:
+    """float(value), or default when the value isn't numeric (None, '', '-', ...)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _str_keyed(stats: Optional[Dict]) -> Dict:
+    """Re-key a stats dict by str stat ID ('12', never 12) so lookups need a single get."""
+    return {str(k): v for k, v in stats.items()} if stats else {}
+
+# Stat ID -> display name, reachable by both the '12' and 12 forms of an ID
+_STAT_ID_TO_NAME = {**STAT_ID_MAP, **{int(k): v for k, v in STAT_ID_MAP.items()}}
+
+
+@lru_cache(maxsize=256)
+def _parse_ratio(value: str) -> float:
+    """Convert a Yahoo 'made/attempted' string (e.g. '4/8') to a percentage."""
+    try:
+        num, denom = value.split('/')[:2]
+        num, denom = float(num), float(denom)
+    except ValueError:
+        return 0
+    return (num / denom * 100) if denom > 0 else 0
+
+
+# Every roster projected for a week (2 per matchup) resolves the same week bounds and
+# past/remaining split, so both are memoized on their (hashable) inputs
+@lru_cache(maxsize=64)
+def _parse_week_bounds(week_start: str, week_end: str) -> Tuple[datetime, datetime]:
+    """Parse Yahoo 'YYYY-MM-DD' week dates; the end runs through 23:59:59."""
+    return (datetime.strptime(week_start, '%Y-%m-%d'),
+            datetime.strptime(week_end, '%Y-%m-%d').replace(hour=23, minute=59, second=59))
+
+
+@lru_cache(maxsize=64)
+def _split_week(week_start: datetime, week_end: datetime,
+                today: datetime) -> Tuple[Tuple[datetime, ...], Tuple[datetime, ...], Tuple[str, ...]]:
+    """Split the week's days at `today`: (past days, remaining days, past days as 'YYYY-MM-DD')."""
+    week_days = [week_start + timedelta(days=i) for i in range((week_end - week_start).days + 1)]
+    split = bisect_left(week_days, today)
+    past_days = tuple(week_days[:split])
+    return past_days, tuple(week_days[split:]), tuple(day.strftime('%Y-%m-%d') for day in past_days)
+
+def _select_daily_starters(eligible: np.ndarray, is_bench: np.ndarray,
+                           limit: int = MAX_DAILY_STARTERS) -> np.ndarray:
+    """Pick the players counted each day from a (days, players) eligibility mask.
     
-    # Check if should be skipped (0%)
-    if status in INJURY_SKIP:
-        return 0.0
+    Starters come before bench players, each in roster order, and only the
+    first `limit` per day are kept (Yahoo's daily starters cap).
+    """
+    order = np.concatenate((np.flatnonzero(~is_bench), np.flatnonzero(is_bench)))
+    ranked = eligible[:, order]
+    counted = np.zeros_like(eligible)
+    counted[:, order] = ranked & (np.cumsum(ranked, axis=1) <= limit)
+    return counted
+
+
+# ==================== REPORT FORMATTING ====================
+
+_RULE = "-" * 60
+_DOUBLE_RULE = "=" * 60
+
+# One row of the category table: category, my value, opponent value, winner
+_ROW_FMT = "{:<10} {:<12} {:<12} {:<10}".format
+
+# Category winner -> table label (anything else reads as a tie)
+_WINNER_STR = {'my_team': "✅ אתה", 'opponent': "❌ יריב"}
+_TIE_STR = "➡️ תיקו"
+
+# Score verdict, keyed by sign(my_score - opp_score)
+_VERDICT_STR = {1: "   ✅ צפי לניצחון!", -1: "   ⚠️ צפי להפסד", 0: "   ➡️ צפי לתיקו"}
+
+# Static scaffolding around the dynamic parts of the report, pre-joined
+_CATEGORY_TABLE_HEADER = "\n".join((
+    _RULE, "פירוט לפי קטגוריה:", _RULE, _ROW_FMT('קטגוריה', 'אתה', 'יריב', 'מנצח'), _RULE,
+))
+_INJURED_HEADER = "\n".join(("", _RULE, "שחקנים פצועים/מפוקפקים:", _RULE))
+_REPORT_FOOTER = "\n" + _DOUBLE_RULE
+
+# Whole report as one template; only the holes are filled per render
+_REPORT_TEMPLATE = "\n".join((
+    _DOUBLE_RULE, "📊 חיזוי מאצ'אפ - שבוע {week}", _DOUBLE_RULE, "",
+    "🏀 {my_team}", "   vs", "🏀 {opp_team}", "",
+    "📈 תוצאה חזויה: {my_score}-{opp_score}", "{verdict}", "",
+    _CATEGORY_TABLE_HEADER, "{table}",
+    _INJURED_HEADER, "{injured}",
+    _REPORT_FOOTER,
+)).format
+_MY_INJURED_HEADER = "שלך:"
+_OPP_INJURED_HEADER = "יריב:"
+_NO_INJURIES_BLOCK = "  אין שחקנים פצועים! ✅"
+
+# Injured-player line: status emoji (indexed by "is out"), name, status, note
+_INJURY_EMOJI = ("🟡", "🔴")
+_INJURY_LINE_FMT = "  {} {} ({}) - {}".format
+
+
+def _injury_line(p: PlayerProjection) -> str:
+    """One report line for an injured/doubtful player."""
+    return _INJURY_LINE_FMT(_INJURY_EMOJI[p.injury_adjustment == 0], p.name, p.status, p.injury_note)
+
+
+def _render_injured(injured_my: List[PlayerProjection], injured_opp: List[PlayerProjection]) -> str:
+    """Injured/doubtful section body for both teams."""
+    if not injured_my and not injured_opp:
+        return _NO_INJURIES_BLOCK
     
-    # Check if has probability multiplier
-    if status in INJURY_COUNT:
-        return INJURY_COUNT[status]
+    lines = []
+    if injured_my:
+        lines.append("")
+        lines.append(_MY_INJURED_HEADER)
+        lines.extend(map(_injury_line, injured_my))
     
-    # Default: count unknown statuses as healthy
-    return 1.0
+    if injured_opp:
+        lines.append("")
+        lines.append(_OPP_INJURED_HEADER)
+        lines.extend(map(_injury_line, injured_opp))
+    
+    return "\n".join(lines)
 
 
 class FantasyPredictor:
@@ -228,6 +359,22 @@ class FantasyPredictor:
     COUNTING_STATS = ['3PTM', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'TO']
     RATE_STATS = ['FG%', 'FT%']
     
+    # (category, stat ID) pairs for stat dicts already normalized by _str_keyed()
+    _COUNTING_STAT_IDS = tuple(zip(COUNTING_STATS, map(STAT_CATEGORIES.__getitem__, COUNTING_STATS)))
+    _RATE_STAT_IDS = tuple(zip(RATE_STATS, map(STAT_CATEGORIES.__getitem__, RATE_STATS)))
+    
+    # Column of PTS within a COUNTING_STATS-ordered row
+    _PTS_COLUMN = COUNTING_STATS.index('PTS')
+    
+    # Counting stats of a player with nothing to project, in STAT_CATEGORIES order
+    _ZERO_PROJECTION = dict.fromkeys(STAT_CATEGORIES, 0.0)
+    
+    # Category order shared by the per-category arrays below
+    _CATEGORY_ORDER = tuple(STAT_CATEGORIES)
+    
+    # +1/-1 per category in STAT_CATEGORIES order; -1 where lower is better (TO)
+    _CATEGORY_SIGNS = np.array([-1.0 if cat in NEGATIVE_CATEGORIES else 1.0 for cat in STAT_CATEGORIES])
+    
     def __init__(self):
         self.api = api
         self.schedule = schedule
@@ -321,9 +468,8 @@ class FantasyPredictor:
         debug_print(f"[DEBUG] Got {len(bbref_stats)} player averages from Basketball Reference")
         
         # Collect all player keys for batch fetching from Yahoo
-        all_player_keys = []
-        for player in my_roster + opponent_roster:
-            all_player_keys.append(player['player_key'])
+        all_players = list(chain(my_roster, opponent_roster))
+        all_player_keys = [player['player_key'] for player in all_players]
         
         # Get season stats from Yahoo for all players (fallback if BBRef fails)
         debug_print("[DEBUG] Fetching season stats from Yahoo API as fallback...")
@@ -332,7 +478,7 @@ class FantasyPredictor:
         
         # Build player averages dictionary using Basketball Reference data
         player_averages = {}
-        for player in my_roster + opponent_roster:
+        for player in all_players:
             player_key = player['player_key']
             player_name = player.get('name', '')
             
@@ -367,6 +513,8 @@ class FantasyPredictor:
                 except UnicodeEncodeError:
                     debug_print(f"[DEBUG] Player {player_key}: WARNING - No stats available!")
         
+        # Normalize stat keys once so projections only ever look up '12', never 12
+        player_averages = {key: _str_keyed(stats) for key, stats in player_averages.items()}
         debug_print(f"[DEBUG] Got averages for {len(player_averages)} players")
         
         # Use week dates from Yahoo if available, otherwise calculate
@@ -397,8 +545,9 @@ class FantasyPredictor:
                 week_start_for_projection, _ = get_week_dates_range()
         
         # Calculate initial projections (full week, as if from start of week; supports double weeks)
-        initial_my_projected = self._calculate_initial_projection(my_roster, player_averages, week_start_for_projection, week_end_for_projection)
-        initial_opponent_projected = self._calculate_initial_projection(opponent_roster, player_averages, week_start_for_projection, week_end_for_projection)
+        initial_schedules = {}  # Shared by both rosters: same week, so each NBA team is looked up once
+        initial_my_projected = self._calculate_initial_projection(my_roster, player_averages, week_start_for_projection, week_end_for_projection, initial_schedules)
+        initial_opponent_projected = self._calculate_initial_projection(opponent_roster, player_averages, week_start_for_projection, week_end_for_projection, initial_schedules)
         
         # For past weeks, return actual results with initial projections for comparison
         if is_past_week:
@@ -408,8 +557,8 @@ class FantasyPredictor:
             )
         
         # Get actual stats from Yahoo matchup (accumulated stats for the week so far)
-        my_actual_stats = matchup.get('my_team', {}).get('stats', {})
-        opponent_actual_stats = matchup.get('opponent', {}).get('stats', {})
+        my_actual_stats = _str_keyed(matchup.get('my_team', {}).get('stats'))
+        opponent_actual_stats = _str_keyed(matchup.get('opponent', {}).get('stats'))
         
         debug_print(f"[DEBUG] My team actual stats from Yahoo: {my_actual_stats}")
         debug_print(f"[DEBUG] Opponent actual stats from Yahoo: {opponent_actual_stats}")
@@ -451,6 +600,8 @@ class FantasyPredictor:
         opponent_actual_converted = self._convert_stats_to_categories(opponent_actual_stats)
         
         # Project each team: actual stats (past) + projected stats (remaining)
+        weekly_schedules = {}  # Shared by both teams (same week)
+        todays_games = get_todays_games()
         my_projection = self._project_team_with_actuals(
             my_team_info['team_key'],
             my_team_info['name'],
@@ -465,6 +616,8 @@ class FantasyPredictor:
             yahoo_remaining_override=yahoo_remaining_my_team,
             il_placements=il_placements_my,
             il_removals=il_removals_my,
+            weekly_schedules=weekly_schedules,
+            todays_games=todays_games,
         )
         
         opponent_projection = self._project_team_with_actuals(
@@ -480,6 +633,8 @@ class FantasyPredictor:
             acquisition_dates=acquisition_dates_opponent,
             il_placements=il_placements_opponent,
             il_removals=il_removals_opponent,
+            weekly_schedules=weekly_schedules,
+            todays_games=todays_games,
         )
         
         # Compare projections
@@ -599,7 +754,7 @@ class FantasyPredictor:
             return team_key, self.api.get_team_roster(team_key, week)
         
         # Use ThreadPoolExecutor for parallel fetching
-        with ThreadPoolExecutor(max_workers=6) as executor:
+        with ThreadPoolExecutor(max_workers=min(16, len(all_team_keys) or 1)) as executor:
             futures = {executor.submit(fetch_roster, tk): tk for tk in all_team_keys}
             for future in as_completed(futures):
                 try:
@@ -644,6 +799,9 @@ class FantasyPredictor:
                     # Last fallback: roster stats
                     player_averages[player_key] = player['stats']
         
+        # Normalize stat keys once so projections only ever look up '12', never 12
+        player_averages = {key: _str_keyed(stats) for key, stats in player_averages.items()}
+        
         # Pre-fetch transaction history for all teams mapped in parallel
         yahoo_week_start = matchups[0].get('week_start') if matchups else None
         yahoo_week_end = matchups[0].get('week_end') if matchups else None
@@ -662,7 +820,7 @@ class FantasyPredictor:
                     il_p, il_r = self.api.get_il_history_for_team(league_key, tk, ws_dt, we_dt)
                     return tk, acq, il_p, il_r
                 
-                with ThreadPoolExecutor(max_workers=6) as executor:
+                with ThreadPoolExecutor(max_workers=min(16, len(all_team_keys) or 1)) as executor:
                     hist_futures = {executor.submit(fetch_team_history, tk): tk for tk in all_team_keys}
                     for future in as_completed(hist_futures):
                         try:
@@ -677,6 +835,8 @@ class FantasyPredictor:
                 
         # Predict each matchup
         predictions = []
+        weekly_schedules = {}  # Every team in the league projects the same week
+        todays_games = get_todays_games()
         for matchup in matchups:
             teams = matchup.get('teams', [])
             if len(teams) != 2:
@@ -699,7 +859,7 @@ class FantasyPredictor:
                 team1['name'],
                 all_rosters.get(team1['team_key'], []),
                 player_averages,
-                team1.get('stats', {}),
+                _str_keyed(team1.get('stats')),
                 week_num,  # Pass week number for correct date calculation
                 current_week,  # Pass current week for offset calculation
                 yahoo_week_start,  # Pass Yahoo week_start for double weeks
@@ -707,6 +867,8 @@ class FantasyPredictor:
                 acquisition_dates=acquisition_dates_team1,
                 il_placements=il_placements_team1,
                 il_removals=il_removals_team1,
+                weekly_schedules=weekly_schedules,
+                todays_games=todays_games,
             )
             
             team2_projection = self._project_team_with_actuals(
@@ -714,7 +876,7 @@ class FantasyPredictor:
                 team2['name'],
                 all_rosters.get(team2['team_key'], []),
                 player_averages,
-                team2.get('stats', {}),
+                _str_keyed(team2.get('stats')),
                 week_num,  # Pass week number for correct date calculation
                 current_week,  # Pass current week for offset calculation
                 yahoo_week_start,  # Pass Yahoo week_start for double weeks
@@ -722,6 +884,8 @@ class FantasyPredictor:
                 acquisition_dates=acquisition_dates_team2,
                 il_placements=il_placements_team2,
                 il_removals=il_removals_team2,
+                weekly_schedules=weekly_schedules,
+                todays_games=todays_games,
             )
             
             # Compare projections
@@ -776,9 +940,9 @@ class FantasyPredictor:
                                 initial_opponent_projected: Dict[str, float] = None) -> MatchupPrediction:
         """Get actual results for a completed past week from Yahoo matchup data."""
         
-        # Get actual stats from Yahoo matchup
-        my_stats = matchup.get('my_team', {}).get('stats', {})
-        opponent_stats = matchup.get('opponent', {}).get('stats', {})
+        # Get actual stats from Yahoo matchup, keyed by str stat ID
+        my_stats = _str_keyed(matchup.get('my_team', {}).get('stats'))
+        opponent_stats = _str_keyed(matchup.get('opponent', {}).get('stats'))
         
         debug_print(f"[DEBUG] Past week {week_num} - My actual stats: {my_stats}")
         debug_print(f"[DEBUG] Past week {week_num} - Opponent actual stats: {opponent_stats}")
@@ -788,8 +952,8 @@ class FantasyPredictor:
         opponent_totals = {}
         
         for cat_name, stat_id in self.STAT_CATEGORIES.items():
-            my_val = my_stats.get(stat_id) or my_stats.get(int(stat_id)) or my_stats.get(str(stat_id)) or 0
-            opp_val = opponent_stats.get(stat_id) or opponent_stats.get(int(stat_id)) or opponent_stats.get(str(stat_id)) or 0
+            my_val = my_stats.get(stat_id) or 0
+            opp_val = opponent_stats.get(stat_id) or 0
             
             try:
                 my_val = float(my_val)
@@ -842,17 +1006,24 @@ class FantasyPredictor:
             actual_opponent_stats=opponent_totals
         )
     
-    def _calculate_initial_projection(self, roster: List[Dict], player_averages: Dict, week_start: datetime = None, week_end: datetime = None) -> Dict[str, float]:
+    def _calculate_initial_projection(self, roster: List[Dict], player_averages: Dict, week_start: datetime = None, week_end: datetime = None,
+                                      weekly_schedules: Optional[Dict[str, List[Dict]]] = None) -> Dict[str, float]:
         """Calculate pure initial projection for the entire week (as if from start of week).
         
         This gives us what the projection would be if no games were played yet,
         useful for comparing prediction vs actual results.
+        weekly_schedules is an optional {team_abbr: weekly schedule} memo for the same week.
         """
-        totals = {cat: 0.0 for cat in self.STAT_CATEGORIES.keys()}
-        total_fga = 0.0
-        total_fgm = 0.0
-        total_fta = 0.0
-        total_ftm = 0.0
+        if weekly_schedules is None:
+            weekly_schedules = {}
+        team_games: Dict[str, int] = {}  # Games this week per NBA team, shared by teammates
+        
+        # One row per counted player (struct-of-arrays), reduced with NumPy below
+        raw_rows = []    # Raw COUNTING_STATS values
+        divisors = []    # Games played, or 1 for stats already per-game
+        weights = []     # Games this week x injury factor
+        fg_pcts = []
+        ft_pcts = []
         
         for player in roster:
             # Get roster position
@@ -871,73 +1042,56 @@ class FantasyPredictor:
             
             # Get games this week for player's team (from weekly schedule) for the REQUESTED week (supports double weeks)
             team_abbr = player.get('team', '')
-            weekly_sched = get_team_weekly_schedule(team_abbr, week_start, week_end) if team_abbr else []
-            games = sum(1 for day in weekly_sched if day.get('has_game')) if weekly_sched else 3
+            games = team_games.get(team_abbr)
+            if games is None:
+                weekly_sched = weekly_schedules.get(team_abbr) if team_abbr else []
+                if weekly_sched is None:
+                    weekly_sched = weekly_schedules[team_abbr] = get_team_weekly_schedule(team_abbr, week_start, week_end)
+                games = team_games[team_abbr] = sum(1 for day in weekly_sched if day.get('has_game')) if weekly_sched else 3
             
             # Get player averages
-            avg_stats = player_averages.get(player['player_key'], player.get('stats', {}))
+            avg_stats = player_averages.get(player['player_key'])
+            if avg_stats is None:
+                avg_stats = _str_keyed(player.get('stats'))
             
             # Get games played for per-game calculation
-            games_played = avg_stats.get('0') or avg_stats.get(0) or 1
-            try:
-                games_played = float(games_played) if games_played > 0 else 1
-            except:
+            games_played = _as_float(avg_stats.get('0') or 1, 1)
+            if games_played <= 0:
                 games_played = 1
             
-            is_average = avg_stats.get('_is_average', False)
-            
-            # Add counting stats
-            for cat in self.COUNTING_STATS:
-                stat_id = self.STAT_CATEGORIES[cat]
-                raw_value = avg_stats.get(stat_id) or avg_stats.get(int(stat_id)) or avg_stats.get(str(stat_id)) or 0
-                try:
-                    raw_value = float(raw_value)
-                except:
-                    raw_value = 0
-                
-                if is_average:
-                    per_game = raw_value
-                else:
-                    per_game = raw_value / games_played
-                
-                totals[cat] += per_game * games * injury_factor
-            
-            # Track FG/FT data for percentage calculation
-            pts = avg_stats.get('12') or avg_stats.get(12) or 0
-            try:
-                pts = float(pts) / (1 if is_average else games_played)
-            except:
-                pts = 0
-            
-            fg_pct = avg_stats.get('5') or avg_stats.get(5) or 0.45
-            ft_pct = avg_stats.get('8') or avg_stats.get(8) or 0.75
-            try:
-                fg_pct = float(fg_pct)
-                if fg_pct > 1:
-                    fg_pct = fg_pct / 100
-            except:
-                fg_pct = 0.45
-            try:
-                ft_pct = float(ft_pct)
-                if ft_pct > 1:
-                    ft_pct = ft_pct / 100
-            except:
-                ft_pct = 0.75
-            
-            # Estimate attempts based on points per game
-            est_fga = pts / 2.1 if pts > 0 else 8
-            est_fta = pts / 6 if pts > 0 else 3
-            
-            total_fga += est_fga * games * injury_factor
-            total_fgm += est_fga * fg_pct * games * injury_factor
-            total_fta += est_fta * games * injury_factor
-            total_ftm += est_fta * ft_pct * games * injury_factor
+            raw_rows.append([_as_float(avg_stats.get(stat_id) or 0) for _, stat_id in self._COUNTING_STAT_IDS])
+            divisors.append(1 if avg_stats.get('_is_average', False) else games_played)
+            weights.append(games * injury_factor)
+            fg_pcts.append(_as_float(avg_stats.get('5') or 0.45, 0.45))
+            ft_pcts.append(_as_float(avg_stats.get('8') or 0.75, 0.75))
+        
+        weights = np.array(weights, dtype=np.float64)
+        per_game = np.array(raw_rows, dtype=np.float64).reshape(-1, len(self.COUNTING_STATS))
+        per_game /= np.array(divisors, dtype=np.float64)[:, None]
+        
+        totals = dict(zip(self.COUNTING_STATS, (weights @ per_game).tolist()))
+        
+        # Percentages may arrive as 0-100
+        fg_pct = np.array(fg_pcts, dtype=np.float64)
+        ft_pct = np.array(ft_pcts, dtype=np.float64)
+        fg_pct = np.where(fg_pct > 1, fg_pct / 100, fg_pct)
+        ft_pct = np.where(ft_pct > 1, ft_pct / 100, ft_pct)
+        
+        # Estimate attempts based on points per game
+        pts = per_game[:, self._PTS_COLUMN]
+        est_fga = np.where(pts > 0, pts / 2.1, 8.0)
+        est_fta = np.where(pts > 0, pts / 6, 3.0)
+        
+        total_fga = float(weights @ est_fga)
+        total_fgm = float(weights @ (est_fga * fg_pct))
+        total_fta = float(weights @ est_fta)
+        total_ftm = float(weights @ (est_fta * ft_pct))
         
         # Calculate team percentage stats
         totals['FG%'] = (total_fgm / total_fga * 100) if total_fga > 0 else 0
         totals['FT%'] = (total_ftm / total_fta * 100) if total_fta > 0 else 0
         
-        return totals
+        return {cat: totals[cat] for cat in self.STAT_CATEGORIES}
     
     def _project_team_with_actuals(self, team_key: str, team_name: str, 
                                     roster: List[Dict], player_averages: Dict,
@@ -949,7 +1103,9 @@ class FantasyPredictor:
                                     acquisition_dates: Dict = None,
                                     yahoo_remaining_override: Optional[int] = None,
                                     il_placements: Optional[Dict[str, datetime]] = None,
-                                    il_removals: Optional[Dict[str, datetime]] = None) -> TeamProjection:
+                                    il_removals: Optional[Dict[str, datetime]] = None,
+                                    weekly_schedules: Optional[Dict[str, List[Dict]]] = None,
+                                    todays_games: Optional[Mapping[str, Dict]] = None) -> TeamProjection:
         """Project team stats combining actual results with projections.
         
         Algorithm:
@@ -963,26 +1119,27 @@ class FantasyPredictor:
         - Apply injury rules: Probable/Questionable = count, Doubtful/Out = skip
         - If <= 10 eligible players on a day, include bench
         - If > 10 eligible players, exclude bench (Yahoo "Start Active Players" logic)
+        
+        weekly_schedules: optional {team_abbr: weekly schedule} memo, shared by callers
+        projecting several rosters for the same week so each NBA team is looked up once.
+        todays_games: optional result of get_todays_games(), likewise shared across rosters.
         """
         
         # Yahoo Fantasy uses Pacific Time (PST/PDT) for determining game dates
         # Use Pacific Time to match Yahoo's logic for past vs future games
-        today = datetime.now()
-        today_pst = get_pacific_time()
         today_date_pst = get_pacific_date()
         
-        is_dst = 3 <= today.month <= 10  # Approximate DST period
-        
-        debug_print(f"[DEBUG] Server time (Israel): {today}")
-        debug_print(f"[DEBUG] Pacific time: {today_pst} ({'PDT' if is_dst else 'PST'})")
-        debug_print(f"[DEBUG] Current Pacific date: {today_date_pst.date()}")
+        if DEBUG_MODE:
+            today = datetime.now()
+            is_dst = 3 <= today.month <= 10  # Approximate DST period
+            debug_print(f"[DEBUG] Server time (Israel): {today}")
+            debug_print(f"[DEBUG] Pacific time: {get_pacific_time()} ({'PDT' if is_dst else 'PST'})")
+            debug_print(f"[DEBUG] Current Pacific date: {today_date_pst.date()}")
         
         # Use Yahoo week dates if available (handles double weeks!)
         if yahoo_week_start and yahoo_week_end:
             try:
-                week_start = datetime.strptime(yahoo_week_start, '%Y-%m-%d')
-                week_end = datetime.strptime(yahoo_week_end, '%Y-%m-%d')
-                week_end = week_end.replace(hour=23, minute=59, second=59)
+                week_start, week_end = _parse_week_bounds(yahoo_week_start, yahoo_week_end)
                 debug_print(f"[DEBUG] Using Yahoo week dates: {week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}")
                 debug_print(f"[DEBUG] Week duration: {(week_end - week_start).days + 1} days")
             except:
@@ -1010,24 +1167,48 @@ class FantasyPredictor:
                 debug_print(f"[DEBUG] Using current week dates (fallback)")
         
         # Get today's games for all teams (for display)
-        todays_games = get_todays_games()
+        if todays_games is None:
+            todays_games = get_todays_games()
         
         # Split the week into past days and remaining days (using Pacific Time)
-        past_days = []  # Days that have already passed in Pacific Time
-        remaining_days = []  # Days remaining in Pacific Time (today onwards)
-        
-        current_day = week_start
-        while current_day <= week_end:
-            # Compare dates using Pacific Time
-            if current_day < today_date_pst:
-                past_days.append(current_day)
-            else:
-                remaining_days.append(current_day)
-            current_day += timedelta(days=1)
+        # past_days: already passed in Pacific Time; remaining_days: today onwards
+        past_days, remaining_days, past_day_strs = _split_week(week_start, week_end, today_date_pst)
+        
+        if DEBUG_MODE:
+            debug_print(f"[DEBUG] Past days: {len(past_days)}, Remaining days: {len(remaining_days)}")
+            debug_print(f"[DEBUG] Past dates: {list(past_day_strs)}")
+            debug_print(f"[DEBUG] Remaining dates: {[d.strftime('%Y-%m-%d') for d in remaining_days]}")
         
-        debug_print(f"[DEBUG] Past days: {len(past_days)}, Remaining days: {len(remaining_days)}")
-        debug_print(f"[DEBUG] Past dates: {[d.strftime('%Y-%m-%d') for d in past_days]}")
-        debug_print(f"[DEBUG] Remaining dates: {[d.strftime('%Y-%m-%d') for d in remaining_days]}")
+        # Weekly schedule per NBA team for the REQUESTED week (supports double weeks)
+        if weekly_schedules is None:
+            weekly_schedules = {}
+        
+        def weekly_schedule_for(team_abbr: str) -> List[Dict]:
+            if not team_abbr:
+                return []
+            weekly_sched = weekly_schedules.get(team_abbr)
+            if weekly_sched is None:
+                weekly_sched = weekly_schedules[team_abbr] = get_team_weekly_schedule(team_abbr, week_start, week_end)
+            return weekly_sched
+        
+        # Games and game dates per NBA team in the requested week, shared by teammates
+        team_games: Dict[str, int] = {}
+        team_game_dates: Dict[str, frozenset] = {}
+        
+        def games_for(team_abbr: str) -> int:
+            games = team_games.get(team_abbr)
+            if games is None:
+                weekly_sched = weekly_schedule_for(team_abbr)
+                games = team_games[team_abbr] = sum(1 for day in weekly_sched if day.get('has_game')) if weekly_sched else 3
+            return games
+        
+        def game_dates_for(team_abbr: str) -> frozenset:
+            game_dates = team_game_dates.get(team_abbr)
+            if game_dates is None:
+                game_dates = team_game_dates[team_abbr] = frozenset(
+                    day.get('date') for day in weekly_schedule_for(team_abbr) if day.get('has_game')
+                )
+            return game_dates
         
         # Build player info with positions and injury status
         acquisition_dates = acquisition_dates or {}
@@ -1035,8 +1216,7 @@ class FantasyPredictor:
         for player in roster:
             team_abbr = player.get('team', '')
             # Get weekly schedule (single source of truth for games count) for the REQUESTED week (supports double weeks)
-            weekly_sched = get_team_weekly_schedule(team_abbr, week_start, week_end) if team_abbr else []
-            total_games = sum(1 for day in weekly_sched if day.get('has_game')) if weekly_sched else 3
+            total_games = games_for(team_abbr)
             
             roster_position = player.get('roster_position', '') or player.get('selected_position', '')
             is_on_il = roster_position in INACTIVE_POSITIONS
@@ -1048,7 +1228,9 @@ class FantasyPredictor:
             if is_on_il:
                 injury_factor = 0.0
             
-            avg_stats = player_averages.get(player['player_key'], player.get('stats', {}))
+            avg_stats = player_averages.get(player['player_key'])
+            if avg_stats is None:
+                avg_stats = _str_keyed(player.get('stats'))
             
             # Get today's game info for this player's team
             normalized_team = schedule._normalize_team_abbr(team_abbr) if team_abbr else ''
@@ -1074,8 +1256,32 @@ class FantasyPredictor:
                 'games_counted': 0,  # Will be counted day by day
                 'game_today': game_today,
                 'acquisition_date': acq_date,  # None = was on roster all week
+                'per_game': self._per_game_row(avg_stats),  # Day-invariant, parsed once
             })
         
+        # Per-game stat rows (counting stats, then FGM/FGA/FTM/FTA) scaled by injury
+        # factor, so each day only sums the selected rows
+        n_players = len(player_info)
+        n_counting = len(self.COUNTING_STATS)
+        injury_arr = np.array([p['injury_factor'] for p in player_info], dtype=np.float64)
+        stat_rows = np.array(
+            [p['per_game'] for p in player_info], dtype=np.float64
+        ).reshape(n_players, n_counting + len(FG_DATA_KEYS))
+        stat_rows *= injury_arr[:, None]
+        
+        inactive_arr = np.array([p['roster_position'] in INACTIVE_POSITIONS for p in player_info], dtype=bool)
+        bench_arr = np.array([p['roster_position'] == BENCH_POSITION for p in player_info], dtype=bool)
+        acq_ord = np.array([p['acquisition_date'].toordinal() if p['acquisition_date'] else 0
+                            for p in player_info], dtype=np.int64)
+        
+        # Team codes as indices into one list, so a day's membership test is one lookup per team
+        team_codes = list(dict.fromkeys(
+            code for p in player_info for code in (p['team_abbr'], p['normalized_team'])
+        ))
+        code_pos = {code: i for i, code in enumerate(team_codes)}
+        abbr_idx = np.array([code_pos[p['team_abbr']] for p in player_info], dtype=np.intp)
+        norm_idx = np.array([code_pos[p['normalized_team']] for p in player_info], dtype=np.intp)
+        
         # Helper function to calculate stats for a list of days (day-by-day approach)
         def calculate_daily_stats(
             days_list: List[datetime], 
@@ -1092,17 +1298,30 @@ class FantasyPredictor:
                 il_placements: {player_key: placement_date} when player was moved to IL
                 il_removals: {player_key: removal_date} when player was removed from IL
             """
-            stats = {cat: 0.0 for cat in self.COUNTING_STATS}
-            fg_data = {'fgm': 0.0, 'fga': 0.0, 'ftm': 0.0, 'fta': 0.0}
-            games_counted = 0  # Track games using Yahoo's 10/day limit
-            
             il_placements = il_placements or {}
             il_removals = il_removals or {}
             
+            # IL window per player as [start, end) day ordinals; no placement = never on IL
+            no_end = date.max.toordinal() + 1
+            il_start = np.array([il_placements[p['player_key']].toordinal() if p['player_key'] in il_placements else no_end
+                                 for p in player_info], dtype=np.int64)
+            il_end = np.array([il_removals[p['player_key']].toordinal() if p['player_key'] in il_removals else no_end
+                               for p in player_info], dtype=np.int64)
+            
+            # Skip injured (Out/Doubtful) players, unless on IL and we're including IL for past days;
+            # skip IL/IL+ slots unless we're counting past days
+            if include_il_players:
+                base_mask = (injury_arr != 0.0) | inactive_arr
+            else:
+                base_mask = (injury_arr != 0.0) & ~inactive_arr
+            
             # Fetch full NBA schedule once (same source as visual schedule display)
             full_schedule = get_full_nba_schedule()
             debug_print(f"[DEBUG] Using NBA Official API schedule with {len(full_schedule)} dates")
             
+            # Collect the days that have games, with a (days, team codes) table of who plays
+            game_days = []
+            team_plays = []
             for day in days_list:
                 # Get teams playing on this day from NBA Official API
                 day_str = day.strftime('%Y-%m-%d')
@@ -1113,184 +1332,54 @@ class FantasyPredictor:
                     continue
                 
                 # Get teams from the day's schedule
-                teams_playing = list(full_schedule[day_str].keys()) if full_schedule[day_str] else []
+                teams_playing = full_schedule[day_str] or {}
                 
                 # If we have data but no games (e.g., All-Star break), count 0 games (skip day)
                 if not teams_playing:
                     debug_print(f"[DEBUG] Confirmed no games on {day_str} (e.g., All-Star break)")
                     continue
                 
-                # Filter to eligible players for this day (including bench; optionally IL for past days)
-                eligible_players = []
-                bench_players = []
-                
-                for p in player_info:
-                    player_key = p['player_key']
-                    day_date = day.date()
-                    
-                    # Check if player was on IL on this specific day
-                    was_on_il_this_day = False
-                    if player_key in il_placements:
-                        placement_date = il_placements[player_key].date() if hasattr(il_placements[player_key], 'date') else il_placements[player_key]
-                        # If placed on IL and not yet removed, or removal is after this day
-                        if day_date >= placement_date:
-                            # Check if removed from IL before this day
-                            if player_key in il_removals:
-                                removal_date = il_removals[player_key].date() if hasattr(il_removals[player_key], 'date') else il_removals[player_key]
-                                if day_date < removal_date:
-                                    was_on_il_this_day = True
-                            else:
-                                # Still on IL (no removal date)
-                                was_on_il_this_day = True
-                    
-                    # Skip if player was on IL on this day (can't count games while on IL)
-                    if was_on_il_this_day:
-                        continue
-                    
-                    # Skip if injured (Out/Doubtful - didn't play), unless on IL and we're including IL for past days
-                    if p['injury_factor'] == 0.0 and not (include_il_players and p['roster_position'] in INACTIVE_POSITIONS):
-                        continue
-                    
-                    # Skip if on IL/IL+ slot, unless we're counting past days (include_il_players)
-                    if not include_il_players and p['roster_position'] in INACTIVE_POSITIONS:
-                        continue
-                    
-                    # Skip if player was added mid-week and this day is before his acquisition date
-                    if p.get('acquisition_date') and day_date < p['acquisition_date']:
-                        continue
-                    
-                    # Check if team plays today (we have schedule data for this day)
-                    team_plays = (p['team_abbr'] in teams_playing or 
-                                  p['normalized_team'] in teams_playing)
-                    
-                    if not team_plays:
-                        continue
-                    
-                    # Separate bench players from starters
-                    if p['roster_position'] == BENCH_POSITION:
-                        bench_players.append(p)
-                    else:
-                        eligible_players.append(p)
-                
-                # Determine which players to count based on Yahoo's 10/day limit
-                # New SAP Logic: Assume user will start ANY player with a game,
-                # but Yahoo limits to max 10 players per day
-                # Combine all players (starters + bench) and take first 10
-                all_players_with_games = eligible_players + bench_players
-                players_to_count = all_players_with_games[:MAX_DAILY_STARTERS]
-                
-                # Detailed logging
-                day_str = day.strftime('%Y-%m-%d')
-                debug_print(f"[DEBUG] {day_str}: {len(eligible_players)} starters + {len(bench_players)} bench = {len(all_players_with_games)} total")
-                # Count games for this day (Yahoo logic: max 10 per day)
-                games_counted += len(players_to_count)
-                
-                # Log each player being counted
-                for p in players_to_count:
-                    pos = p['roster_position']
-                    name = p['name']
-                    team = p['team_abbr']
-                    try:
-                        debug_print(f"[DEBUG]   -> {name} ({team}) [{pos}]")
-                    except UnicodeEncodeError:
-                        debug_print(f"[DEBUG]   -> Player {p['player_key']} ({team}) [{pos}]")
-                
-                # Add stats for each player (1 game worth)
-                for p in players_to_count:
-                    avg_stats = p['avg_stats']
-                    p['games_counted'] += 1
-                    
-                    # Get games played for per-game calculation
-                    games_played = avg_stats.get('0') or avg_stats.get(0) or 1
-                    try:
-                        games_played = float(games_played) if games_played else 1
-                        if games_played <= 0:
-                            games_played = 1
-                    except:
-                        games_played = 1
-                    
-                    is_average = avg_stats.get('_is_average', False)
-                    
-                    # Add counting stats (1 game worth)
-                    for cat in self.COUNTING_STATS:
-                        stat_id = self.STAT_CATEGORIES[cat]
-                        raw_value = avg_stats.get(stat_id) or avg_stats.get(int(stat_id)) or avg_stats.get(str(stat_id)) or 0
-                        try:
-                            raw_value = float(raw_value)
-                        except:
-                            raw_value = 0
-                        
-                        if is_average:
-                            per_game = raw_value
-                        else:
-                            per_game = raw_value / games_played
-                        
-                        stats[cat] += per_game * p['injury_factor']
-                    
-                    # Track FG/FT data - use actual stats from Yahoo if available
-                    # Stat IDs: '3'=FGA, '4'=FGM, '6'=FTA, '7'=FTM
-                    fga_raw = avg_stats.get('3') or avg_stats.get(3)
-                    fgm_raw = avg_stats.get('4') or avg_stats.get(4)
-                    fta_raw = avg_stats.get('6') or avg_stats.get(6)
-                    ftm_raw = avg_stats.get('7') or avg_stats.get(7)
-                    
-                    # Convert to per-game if needed
-                    if fga_raw is not None and fgm_raw is not None:
-                        try:
-                            fga = float(fga_raw) / (1 if is_average else games_played)
-                            fgm = float(fgm_raw) / (1 if is_average else games_played)
-                        except:
-                            fga, fgm = None, None
-                    else:
-                        fga, fgm = None, None
-                    
-                    if fta_raw is not None and ftm_raw is not None:
-                        try:
-                            fta = float(fta_raw) / (1 if is_average else games_played)
-                            ftm = float(ftm_raw) / (1 if is_average else games_played)
-                        except:
-                            fta, ftm = None, None
-                    else:
-                        fta, ftm = None, None
-                    
-                    # Fallback to estimation if actual stats not available
-                    if fga is None or fgm is None:
-                        pts = avg_stats.get('12') or avg_stats.get(12) or 0
-                        try:
-                            pts = float(pts) / (1 if is_average else games_played)
-                        except:
-                            pts = 0
-                        fg_pct = avg_stats.get('5') or avg_stats.get(5) or 0.45
-                        try:
-                            fg_pct = float(fg_pct)
-                            if fg_pct > 1:
-                                fg_pct = fg_pct / 100
-                        except:
-                            fg_pct = 0.45
-                        fga = pts / 2.1 if pts > 0 else 8
-                        fgm = fga * fg_pct
-                    
-                    if fta is None or ftm is None:
-                        pts = avg_stats.get('12') or avg_stats.get(12) or 0
-                        try:
-                            pts = float(pts) / (1 if is_average else games_played)
-                        except:
-                            pts = 0
-                        ft_pct = avg_stats.get('8') or avg_stats.get(8) or 0.75
+                game_days.append(day)
+                team_plays.append([code in teams_playing for code in team_codes])
+            
+            day_ord = np.array([day.toordinal() for day in game_days], dtype=np.int64)[:, None]
+            team_plays = np.array(team_plays, dtype=bool).reshape(len(game_days), len(team_codes))
+            
+            # Eligible = not on IL that day, acquired by that day, and team plays that day
+            eligible = (base_mask
+                        & ~((il_start <= day_ord) & (day_ord < il_end))
+                        & (acq_ord <= day_ord)
+                        & (team_plays[:, abbr_idx] | team_plays[:, norm_idx]))
+            
+            # Yahoo's 10/day limit: assume the user starts ANY player with a game
+            # (starters first, then bench) and count the first 10
+            counted = _select_daily_starters(eligible, bench_arr)
+            counts = counted.sum(axis=0)
+            games_counted = int(counts.sum())  # Track games using Yahoo's 10/day limit
+            
+            # Detailed logging
+            if DEBUG_MODE:
+                for day, day_eligible, day_counted in zip(game_days, eligible, counted):
+                    n_bench = int((day_eligible & bench_arr).sum())
+                    n_total = int(day_eligible.sum())
+                    debug_print(f"[DEBUG] {day.strftime('%Y-%m-%d')}: {n_total - n_bench} starters + {n_bench} bench = {n_total} total")
+                    for i in np.flatnonzero(day_counted):
+                        p = player_info[i]
+                        pos = p['roster_position']
+                        name = p['name']
+                        team = p['team_abbr']
                         try:
-                            ft_pct = float(ft_pct)
-                            if ft_pct > 1:
-                                ft_pct = ft_pct / 100
-                        except:
-                            ft_pct = 0.75
-                        fta = pts / 6 if pts > 0 else 3
-                        ftm = fta * ft_pct
-                    
-                    fg_data['fgm'] += fgm * p['injury_factor']
-                    fg_data['fga'] += fga * p['injury_factor']
-                    fg_data['ftm'] += ftm * p['injury_factor']
-                    fg_data['fta'] += fta * p['injury_factor']
-
+                            debug_print(f"[DEBUG]   -> {name} ({team}) [{pos}]")
+                        except UnicodeEncodeError:
+                            debug_print(f"[DEBUG]   -> Player {p['player_key']} ({team}) [{pos}]")
+            
+            for p, played in zip(player_info, counts.tolist()):
+                p['games_counted'] += played
+            
+            # One game worth of stats for every counted player-day
+            totals = (counts @ stat_rows).tolist()
+            stats = dict(zip(self.COUNTING_STATS, totals[:n_counting]))
+            fg_data = dict(zip(FG_DATA_KEYS, totals[n_counting:]))
             return stats, fg_data, games_counted
         
         # Calculate stats for past days (already played)
@@ -1318,54 +1407,50 @@ class FantasyPredictor:
         debug_print(f"[DEBUG] Remaining days games (projected, Yahoo logic): {remaining_games_counted}")
         debug_print(f"[DEBUG] ==================================================")
 
-        # Calculate actual games played based on weekly schedule for past days
-        # Count games from weekly_schedule for each player in past days
-        # IMPORTANT: Include IL players for past days (they may have played before being moved to IL)
-        schedule_games_played = 0
-        for p in player_info:
-            # Get weekly schedule for this player's team for the REQUESTED week (supports double weeks)
-            team_abbr = p['team_abbr']
-            weekly_sched = get_team_weekly_schedule(team_abbr, week_start, week_end) if team_abbr else []
+        # Diagnostics only: schedule-based past games vs Yahoo's Games Played. Skipped
+        # unless debugging - the GP fallback costs a Yahoo round trip per team
+        if DEBUG_MODE:
+            # Calculate actual games played based on weekly schedule for past days
+            # Count games from weekly_schedule for each player in past days
+            # IMPORTANT: Include IL players for past days (they may have played before being moved to IL)
+            schedule_games_played = 0
+            for p in player_info:
+                # Dates this player's team plays in the REQUESTED week (supports double weeks)
+                game_dates = game_dates_for(p['team_abbr'])
             
-            # Count games in past days (include IL players - they may have played before IL)
-            for day in past_days:
-                day_str = day.strftime('%Y-%m-%d')
-                # Find this day in the weekly schedule
-                for sched_day in weekly_sched:
-                    if sched_day.get('date') == day_str and sched_day.get('has_game'):
-                        schedule_games_played += 1
-                        break
+                # Count games in past days (include IL players - they may have played before IL)
+                schedule_games_played += sum(1 for day_str in past_day_strs if day_str in game_dates)
+        
+            debug_print(f"[DEBUG] Games played from schedule (past {len(past_days)} days, includes IL): {schedule_games_played}")
+            debug_print(f"[DEBUG] Games counted with Yahoo logic (calculated): {past_games_counted_calc}")
+        
+            # Try to get actual games played from Yahoo (stat_id 0 = Games Played)
+            yahoo_gp = None
+            if actual_stats:
+                raw_gp = actual_stats.get('0')
+                if raw_gp is None:
+                    for k, v in actual_stats.items():
+                        if k.strip() == '0':
+                            raw_gp = v
+                            break
+                if raw_gp is not None:
+                    try:
+                        yahoo_gp = int(float(raw_gp))
+                        debug_print(f"[DEBUG] Yahoo GP from matchup stats (actual, includes roster changes): {yahoo_gp} vs Schedule count: {schedule_games_played}")
+                    except (TypeError, ValueError):
+                        yahoo_gp = None
         
-        debug_print(f"[DEBUG] Games played from schedule (past {len(past_days)} days, includes IL): {schedule_games_played}")
-        debug_print(f"[DEBUG] Games counted with Yahoo logic (calculated): {past_games_counted_calc}")
-        
-        # Try to get actual games played from Yahoo (stat_id 0 = Games Played)
-        yahoo_gp = None
-        if actual_stats:
-            raw_gp = actual_stats.get('0') or actual_stats.get(0)
-            if raw_gp is None:
-                for k, v in actual_stats.items():
-                    if str(k).strip() == '0':
-                        raw_gp = v
-                        break
-            if raw_gp is not None:
+            # If Games Played not in matchup stats, fetch from team stats endpoint
+            if yahoo_gp is None and week_num is not None:
                 try:
-                    yahoo_gp = int(float(raw_gp))
-                    debug_print(f"[DEBUG] Yahoo GP from matchup stats (actual, includes roster changes): {yahoo_gp} vs Schedule count: {schedule_games_played}")
-                except (TypeError, ValueError):
-                    yahoo_gp = None
-        
-        # If Games Played not in matchup stats, fetch from team stats endpoint
-        if yahoo_gp is None and week_num is not None:
-            try:
-                debug_print(f"[DEBUG] Fetching team stats for {team_key} week {week_num} to get GP...")
-                team_stats = self.api.get_team_stats(team_key, week_num)
-                raw_gp = team_stats.get('0') or team_stats.get(0)
-                if raw_gp is not None:
-                    yahoo_gp = int(float(raw_gp))
-                    debug_print(f"[DEBUG] Yahoo GP from team stats (actual, includes roster changes): {yahoo_gp} vs Schedule count: {schedule_games_played}")
-            except Exception as e:
-                debug_print(f"[DEBUG] Failed to fetch team stats for GP: {e}")
+                    debug_print(f"[DEBUG] Fetching team stats for {team_key} week {week_num} to get GP...")
+                    team_stats = self.api.get_team_stats(team_key, week_num)
+                    raw_gp = team_stats.get('0') or team_stats.get(0)
+                    if raw_gp is not None:
+                        yahoo_gp = int(float(raw_gp))
+                        debug_print(f"[DEBUG] Yahoo GP from team stats (actual, includes roster changes): {yahoo_gp} vs Schedule count: {schedule_games_played}")
+                except Exception as e:
+                    debug_print(f"[DEBUG] Failed to fetch team stats for GP: {e}")
         
         debug_print(f"[DEBUG] Remaining days games (projected, Yahoo logic): {remaining_games_counted}")
         
@@ -1392,7 +1477,7 @@ class FantasyPredictor:
             # Extract actual counting stats from Yahoo
             actual_counting = {}
             for stat_id, value in actual_stats.items():
-                cat_name = stat_id_to_cat.get(str(stat_id))
+                cat_name = stat_id_to_cat.get(stat_id)
                 if cat_name and cat_name in self.COUNTING_STATS:
                     actual_counting[cat_name] = float(value) if value else 0
             
@@ -1408,8 +1493,8 @@ class FantasyPredictor:
             
             # For FG%/FT%, use Yahoo actual data for past + projected for remaining
             # Yahoo provides FG% and FT% directly, we need to estimate FGM/FGA from actual
-            actual_fg_pct = actual_stats.get('5', 0) or actual_stats.get(5, 0)
-            actual_ft_pct = actual_stats.get('8', 0) or actual_stats.get(8, 0)
+            actual_fg_pct = actual_stats.get('5', 0)
+            actual_ft_pct = actual_stats.get('8', 0)
             actual_pts = actual_counting.get('PTS', 0)
             
             # Estimate past FGA/FTA from actual points and percentages
@@ -1451,14 +1536,12 @@ class FantasyPredictor:
             proj_stats = self._project_player_stats(
                 p['avg_stats'], 
                 p['games_counted'], 
-                p['injury_factor']
+                p['injury_factor'],
+                per_game=p['per_game']
             )
             
             # Get weekly schedule for this player's team for the REQUESTED week (supports double weeks)
-            weekly_sched = get_team_weekly_schedule(p['team_abbr'], week_start, week_end) if p['team_abbr'] else []
-            
-            # Count games from weekly schedule (correct for both normal and double weeks)
-            games_count = sum(1 for day in weekly_sched if day.get('has_game')) if weekly_sched else p['total_games']
+            weekly_sched = weekly_schedule_for(p['team_abbr'])
             
             player_projections.append(PlayerProjection(
                 player_key=p['player_key'],
@@ -1468,7 +1551,7 @@ class FantasyPredictor:
                 roster_position=p['roster_position'],
                 status=p['status'],
                 injury_note=p['injury_note'],
-                games_this_week=games_count,
+                games_this_week=p['total_games'],
                 avg_stats=self._convert_stat_ids_to_names(p['avg_stats']),
                 projected_stats=proj_stats,
                 injury_adjustment=p['injury_factor'],
@@ -1533,7 +1616,9 @@ class FantasyPredictor:
                 injury_adj = 0.0
             
             # Get player's average stats
-            avg_stats = player_averages.get(player['player_key'], player.get('stats', {}))
+            avg_stats = player_averages.get(player['player_key'])
+            if avg_stats is None:
+                avg_stats = _str_keyed(player.get('stats'))
             
             # Project stats (will be 0 if on IL due to injury_adj = 0)
             projected = self._project_player_stats(avg_stats, games, injury_adj)
@@ -1569,29 +1654,97 @@ class FantasyPredictor:
             total_projected=total_projected
         )
     
+    def _per_game_row(self, avg_stats: Dict) -> List[float]:
+        """Per-game values for one player: COUNTING_STATS in order, then FGM/FGA/FTM/FTA.
+        
+        Falls back to estimating shooting attempts from points when Yahoo
+        didn't return FGA/FGM or FTA/FTM.
+        """
+        # Get games played for per-game calculation
+        games_played = _as_float(avg_stats.get('0') or 1, 1)
+        if games_played <= 0:
+            games_played = 1
+        
+        # Season totals are divided by games played; '_is_average' stats already are per-game
+        divisor = 1 if avg_stats.get('_is_average', False) else games_played
+        
+        row = []
+        for cat, stat_id in self._COUNTING_STAT_IDS:
+            row.append(_as_float(avg_stats.get(stat_id) or 0) / divisor)
+        
+        # Track FG/FT data - use actual stats from Yahoo if available
+        # Stat IDs: '3'=FGA, '4'=FGM, '6'=FTA, '7'=FTM; a 0 (or empty) value counts as missing
+        fga = _as_float(avg_stats.get('3') or None, None)
+        fgm = _as_float(avg_stats.get('4') or None, None)
+        fta = _as_float(avg_stats.get('6') or None, None)
+        ftm = _as_float(avg_stats.get('7') or None, None)
+        
+        # Convert to per-game; a made/attempted pair is only used if both halves are numeric
+        if fga is None or fgm is None:
+            fga, fgm = None, None
+        else:
+            fga, fgm = fga / divisor, fgm / divisor
+        
+        if fta is None or ftm is None:
+            fta, ftm = None, None
+        else:
+            fta, ftm = fta / divisor, ftm / divisor
+        
+        # Fallback to estimation if actual stats not available
+        if fga is None or fta is None:
+            pts = _as_float(avg_stats.get('12') or 0) / divisor
+        
+        if fga is None:
+            fg_pct = _as_float(avg_stats.get('5') or 0.45, 0.45)
+            if fg_pct > 1:
+                fg_pct = fg_pct / 100
+            fga = pts / 2.1 if pts > 0 else 8
+            fgm = fga * fg_pct
+        
+        if fta is None:
+            ft_pct = _as_float(avg_stats.get('8') or 0.75, 0.75)
+            if ft_pct > 1:
+                ft_pct = ft_pct / 100
+            fta = pts / 6 if pts > 0 else 3
+            ftm = fta * ft_pct
+        
+        row.extend((fgm, fga, ftm, fta))
+        return row
+    
     def _project_player_stats(self, avg_stats: Dict, games: int, 
-                               injury_adj: float) -> Dict[str, float]:
-        """Project a player's stats for the week"""
-        projected = {}
+                               injury_adj: float,
+                               per_game: Optional[List[float]] = None) -> Dict[str, float]:
+        """Project a player's stats for the week.
         
-
+        per_game: optional row from _per_game_row(); when given, counting stats
+        come from it instead of being re-derived from avg_stats.
+        """
+        if games == 0 or injury_adj == 0.0:
+            # Nothing to project (IL/out or no games left): counting stats are zero,
+            # only the rate stats still need reading
+            projected = self._ZERO_PROJECTION.copy()
+            for cat_name, stat_id in self._RATE_STAT_IDS:
+                raw_value = _as_float(avg_stats.get(stat_id) or 0)
+                if raw_value < 1 and raw_value > 0:
+                    raw_value = raw_value * 100
+                projected[cat_name] = raw_value
+            projected['_games'] = 0.0
+            return projected
+        
+        projected = {}
+        per_game_counting = dict(zip(self.COUNTING_STATS, per_game)) if per_game is not None else None
         
         # Get games played for calculating per-game averages (stat_id 0)
-        games_played = avg_stats.get('0') or avg_stats.get(0) or 1
-        try:
-            games_played = float(games_played) if games_played > 0 else 1
-        except:
+        games_played = _as_float(avg_stats.get('0') or 1, 1)
+        if games_played <= 0:
             games_played = 1
         
         for cat_name, stat_id in self.STAT_CATEGORIES.items():
-            # Try both string and int keys
-            raw_value = avg_stats.get(stat_id) or avg_stats.get(int(stat_id)) or avg_stats.get(str(stat_id)) or 0
-            try:
-                raw_value = float(raw_value)
-            except:
-                raw_value = 0
+            raw_value = _as_float(avg_stats.get(stat_id) or 0)
             
-            if cat_name in self.COUNTING_STATS:
+            if per_game_counting is not None and cat_name in per_game_counting:
+                projected[cat_name] = per_game_counting[cat_name] * games * injury_adj
+            elif cat_name in self.COUNTING_STATS:
                 # Convert season total to per-game average, then multiply by projected games
                 per_game_avg = raw_value / games_played
                 projected[cat_name] = per_game_avg * games * injury_adj
@@ -1602,8 +1755,6 @@ class FantasyPredictor:
                     raw_value = raw_value * 100
                 projected[cat_name] = raw_value
         
-
-        
         # Store games for rate stat calculations
         projected['_games'] = games * injury_adj
         
@@ -1613,8 +1764,6 @@ class FantasyPredictor:
         """Aggregate projected stats for all players on a team"""
         totals = {cat: 0.0 for cat in self.STAT_CATEGORIES.keys()}
         
-
-        
         # For rate stats, we need weighted averages
         total_fga = 0  # Field Goals Attempted (for FG%)
         total_fgm = 0  # Field Goals Made
@@ -1648,115 +1797,71 @@ class FantasyPredictor:
         totals['FG%'] = (total_fgm / total_fga * 100) if total_fga > 0 else 0
         totals['FT%'] = (total_ftm / total_fta * 100) if total_fta > 0 else 0
         
-
-        
         return totals
     
     def _compare_projections(self, my_team: TeamProjection, 
                              opponent: TeamProjection) -> Tuple[Dict, Tuple, Dict]:
         """Compare two team projections and predict winner for each category"""
         
-        category_winners = {}
-        confidence = {}
-        my_wins = 0
-        opp_wins = 0
-        
         # Add epsilon to prevent strict float equality ties from breaking math
         EPSILON = 1e-5
         
-        for cat in self.STAT_CATEGORIES.keys():
-            my_val = my_team.total_projected.get(cat, 0)
-            opp_val = opponent.total_projected.get(cat, 0)
-            
-            # For turnovers, lower is better
-            if cat in NEGATIVE_CATEGORIES:
-                my_val, opp_val = -my_val, -opp_val
-            
-            # Determine winner with epsilon
-            if my_val > opp_val + EPSILON:
-                category_winners[cat] = 'my_team'
-                my_wins += 1
-            elif opp_val > my_val + EPSILON:
-                category_winners[cat] = 'opponent'
-                opp_wins += 1
-            else:
-                category_winners[cat] = 'tie'
-            
-            # Calculate confidence (how close is the matchup)
-            total = abs(my_val) + abs(opp_val)
-            if total > 0:
-                diff = abs(my_val - opp_val)
-                confidence[cat] = min(diff / total, 1.0)
-            else:
-                confidence[cat] = 0.5
-        
-        return category_winners, (my_wins, opp_wins), confidence
+        cats = self._CATEGORY_ORDER
+        my_get = my_team.total_projected.get
+        opp_get = opponent.total_projected.get
+        # For turnovers, lower is better: flip the sign so "higher wins" holds everywhere
+        my_vals = self._CATEGORY_SIGNS * np.fromiter((my_get(cat, 0) for cat in cats), dtype=np.float64, count=len(cats))
+        opp_vals = self._CATEGORY_SIGNS * np.fromiter((opp_get(cat, 0) for cat in cats), dtype=np.float64, count=len(cats))
+        
+        # Determine winner with epsilon
+        my_better = my_vals > opp_vals + EPSILON
+        opp_better = opp_vals > my_vals + EPSILON
+        
+        # Calculate confidence (how close is the matchup)
+        total = np.abs(my_vals) + np.abs(opp_vals)
+        has_total = total > 0
+        closeness = np.minimum(np.abs(my_vals - opp_vals) / np.where(has_total, total, 1.0), 1.0)
+        
+        category_winners = {
+            cat: 'my_team' if mine else 'opponent' if theirs else 'tie'
+            for cat, mine, theirs in zip(cats, my_better.tolist(), opp_better.tolist())
+        }
+        confidence = dict(zip(cats, np.where(has_total, closeness, 0.5).tolist()))
+        
+        return category_winners, (int(my_better.sum()), int(opp_better.sum())), confidence
     
     def _convert_stat_ids_to_names(self, stats: Dict) -> Dict[str, float]:
         """Convert stat IDs to human-readable names"""
         converted = {}
         for stat_id, value in stats.items():
-            stat_name = STAT_ID_MAP.get(str(stat_id), f'stat_{stat_id}')
-            try:
-                if isinstance(value, str) and '/' in value:
-                    parts = value.split('/')
-                    num = float(parts[0])
-                    denom = float(parts[1])
-                    converted[stat_name] = (num / denom * 100) if denom > 0 else 0
-                else:
-                    converted[stat_name] = float(value) if value else 0
-            except:
-                converted[stat_name] = 0
+            stat_name = _STAT_ID_TO_NAME.get(stat_id) or f'stat_{stat_id}'
+            if isinstance(value, str) and '/' in value:
+                converted[stat_name] = _parse_ratio(value)
+            else:
+                converted[stat_name] = _as_float(value)
         return converted
     
     def _convert_stats_to_categories(self, stats: Dict) -> Dict[str, float]:
         """Convert Yahoo stat IDs to category names for display"""
         converted = {}
         for cat_name, stat_id in self.STAT_CATEGORIES.items():
-            value = stats.get(stat_id) or stats.get(int(stat_id)) or stats.get(str(stat_id)) or 0
-            try:
-                value = float(value)
-                # Convert decimal percentages to regular percentages (0.485 -> 48.5)
-                if cat_name in ['FG%', 'FT%']:
-                    if 0 < value < 1:
-                        value = value * 100
-                converted[cat_name] = value
-            except:
-                converted[cat_name] = 0
+            value = _as_float(stats.get(stat_id) or 0)
+            # Convert decimal percentages to regular percentages (0.485 -> 48.5)
+            if cat_name in ['FG%', 'FT%']:
+                if 0 < value < 1:
+                    value = value * 100
+            converted[cat_name] = value
         return converted
     
     def format_prediction_report(self, prediction: MatchupPrediction) -> str:
-        """Format prediction as a readable report"""
-        lines = []
-        lines.append("=" * 60)
-        lines.append(f"📊 חיזוי מאצ'אפ - שבוע {prediction.week}")
-        lines.append("=" * 60)
-        lines.append("")
+        """Format prediction as a readable report (rendered once per prediction)"""
+        if prediction._report is not None:
+            return prediction._report
         
-        # Teams
         my_score, opp_score = prediction.predicted_score
-        lines.append(f"🏀 {prediction.my_team.team_name}")
-        lines.append(f"   vs")
-        lines.append(f"🏀 {prediction.opponent.team_name}")
-        lines.append("")
-        
-        # Predicted score
-        lines.append(f"📈 תוצאה חזויה: {my_score}-{opp_score}")
-        if my_score > opp_score:
-            lines.append("   ✅ צפי לניצחון!")
-        elif opp_score > my_score:
-            lines.append("   ⚠️ צפי להפסד")
-        else:
-            lines.append("   ➡️ צפי לתיקו")
-        lines.append("")
         
         # Category breakdown
-        lines.append("-" * 60)
-        lines.append("פירוט לפי קטגוריה:")
-        lines.append("-" * 60)
-        lines.append(f"{'קטגוריה':<10} {'אתה':<12} {'יריב':<12} {'מנצח':<10}")
-        lines.append("-" * 60)
-        
+        rows = []
         for cat in self.STAT_CATEGORIES.keys():
             my_val = prediction.my_team.total_projected.get(cat, 0)
             opp_val = prediction.opponent.total_projected.get(cat, 0)
@@ -1771,43 +1876,22 @@ class FantasyPredictor:
                 opp_str = f"{opp_val:.1f}"
             
             # Winner indicator
-            if winner == 'my_team':
-                winner_str = "✅ אתה"
-            elif winner == 'opponent':
-                winner_str = "❌ יריב"
-            else:
-                winner_str = "➡️ תיקו"
+            winner_str = _WINNER_STR.get(winner, _TIE_STR)
             
-            lines.append(f"{cat:<10} {my_str:<12} {opp_str:<12} {winner_str:<10}")
-        
-        lines.append("")
-        lines.append("-" * 60)
-        lines.append("שחקנים פצועים/מפוקפקים:")
-        lines.append("-" * 60)
-        
-        # Injured players
-        injured_my = [p for p in prediction.my_team.players if p.injury_adjustment < 1.0]
-        injured_opp = [p for p in prediction.opponent.players if p.injury_adjustment < 1.0]
-        
-        if injured_my:
-            lines.append(f"\nשלך:")
-            for p in injured_my:
-                status_emoji = "🔴" if p.injury_adjustment == 0 else "🟡"
-                lines.append(f"  {status_emoji} {p.name} ({p.status}) - {p.injury_note}")
-        
-        if injured_opp:
-            lines.append(f"\nיריב:")
-            for p in injured_opp:
-                status_emoji = "🔴" if p.injury_adjustment == 0 else "🟡"
-                lines.append(f"  {status_emoji} {p.name} ({p.status}) - {p.injury_note}")
-        
-        if not injured_my and not injured_opp:
-            lines.append("  אין שחקנים פצועים! ✅")
-        
-        lines.append("")
-        lines.append("=" * 60)
-        
-        return "\n".join(lines)
+            rows.append(_ROW_FMT(cat, my_str, opp_str, winner_str))
+        
+        # Fill the precompiled template
+        prediction._report = _REPORT_TEMPLATE(
+            week=prediction.week,
+            my_team=prediction.my_team.team_name,
+            opp_team=prediction.opponent.team_name,
+            my_score=my_score,
+            opp_score=opp_score,
+            verdict=_VERDICT_STR[(my_score > opp_score) - (my_score < opp_score)],
+            table="\n".join(rows),
+            injured=_render_injured(prediction.my_team.injured, prediction.opponent.injured),
+        )
+        return prediction._report
 
 
 # Singleton instance
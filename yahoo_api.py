@@ -13,6 +13,19 @@ from functools import wraps
 from yahoo_auth import auth
 from config import YAHOO_FANTASY_API_URL, CATEGORIES, DEBUG_MODE, IS_VERCEL
 
+# orjson reads/writes the disk cache several times faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 def debug_print(*args, **kwargs):
     """Print only if DEBUG_MODE is enabled."""
     if DEBUG_MODE:
@@ -55,8 +68,8 @@ def _load_cache_from_disk():
         return
     
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(CACHE_FILE, 'rb') as f:
+            data = _json_loads(f.read())
         
         now = datetime.now()
         loaded_count = 0
@@ -92,8 +105,8 @@ def _save_cache_to_disk():
                 'expires': cached['expires'].isoformat()
             }
         
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
+        with open(CACHE_FILE, 'wb') as f:
+            f.write(_json_dumps(data))
         
     except Exception as e:
         debug_print(f"[Yahoo API] Error saving cache to disk: {e}")
@@ -147,6 +160,19 @@ def _set_cached(key: str, data: Any, ttl_seconds: int):
     _save_cache_to_disk()
 
 
+def _set_cached_many(items: Dict[str, Any], ttl_seconds: int):
+    """Store several values with one TTL and a single disk write. Handles user prefixing."""
+    if not items:
+        return
+    prefix = _user_cache_prefix()
+    expires = datetime.now() + timedelta(seconds=ttl_seconds)
+    for key, data in items.items():
+        if prefix and not key.startswith(f"{prefix}:"):
+            key = f"{prefix}:{key}"
+        _api_cache[key] = {'data': data, 'expires': expires}
+    _save_cache_to_disk()
+
+
 def clear_cache_by_pattern(pattern: str):
     """Clear cache entries that match the given pattern (e.g., 'roster:', 'transactions:').
     Useful for forcing a refresh of specific data types.
@@ -950,79 +976,68 @@ class YahooFantasyAPI:
         return team_records
     
     def get_player_stats_averages(self, player_keys: List[str]) -> Dict[str, Dict]:
-        """Get season stats for multiple players (cached per batch of 25)."""
+        """Get season stats for multiple players (cached per player).
+        
+        Per-player entries let overlapping requests (one matchup, then the whole
+        league) share cached stats; only uncached players are fetched.
+        """
         if not player_keys:
             return {}
         
-        # Yahoo API allows max 25 players per request - cache each batch
         results = {}
-        batches_to_fetch = []
-        
-        for i in range(0, len(player_keys), 25):
-            batch = player_keys[i:i+25]
-            batch_key = ','.join(sorted(batch))
-            cache_key = f"player_stats:{batch_key}"
-            cached_batch = _get_cached(cache_key)
-            if cached_batch is not None:
-                results.update(cached_batch)
+        missing = []
+        for player_key in dict.fromkeys(player_keys):
+            cached = _get_cached(f"player_stats:{player_key}")
+            if cached is not None:
+                results[player_key] = cached
             else:
-                batches_to_fetch.append((batch, cache_key))
+                missing.append(player_key)
                 
-        if not batches_to_fetch:
+        if not missing:
             return results
+        
+        # Yahoo API allows max 25 players per request
+        batches_to_fetch = [missing[i:i+25] for i in range(0, len(missing), 25)]
             
-        def fetch_batch(batch_data):
-            batch, cache_key = batch_data
-            keys_str = ','.join(batch)
+        def parse_players(root) -> Dict[str, Dict]:
             batch_results = {}
-            try:
-                root = self._make_request(f"players;player_keys={keys_str}/stats;type=season")
-                players_found = root.findall('.//yh:player', NS)
+            for player in root.findall('.//yh:player', NS):
+                player_key = self._get_text(player, 'yh:player_key')
+                stats = {}
                 
-                for player in players_found:
-                    player_key = self._get_text(player, 'yh:player_key')
-                    stats = {}
-                    
-                    for stat in player.findall('.//yh:stat', NS):
-                        stat_id = self._get_text(stat, 'yh:stat_id')
-                        value = self._get_text(stat, 'yh:value')
-                        stats[stat_id] = self._parse_stat_value(value)
-                    
-                    if stats:
-                        stats['_is_average'] = False
-                        batch_results[player_key] = stats
+                for stat in player.findall('.//yh:stat', NS):
+                    stat_id = self._get_text(stat, 'yh:stat_id')
+                    value = self._get_text(stat, 'yh:value')
+                    stats[stat_id] = self._parse_stat_value(value)
                 
-                if batch_results:
-                    _set_cached(cache_key, batch_results, CACHE_TTL['player_stats'])
-                return batch_results
+                if stats:
+                    stats['_is_average'] = False
+                    batch_results[player_key] = stats
+            return batch_results
+        
+        def fetch_batch(batch):
+            keys_str = ','.join(batch)
+            try:
+                return parse_players(self._make_request(f"players;player_keys={keys_str}/stats;type=season"))
             except Exception as e:
                 # Try without type parameter
                 try:
-                    root = self._make_request(f"players;player_keys={keys_str}/stats")
-                    for player in root.findall('.//yh:player', NS):
-                        player_key = self._get_text(player, 'yh:player_key')
-                        stats = {}
-                        for stat in player.findall('.//yh:stat', NS):
-                            stat_id = self._get_text(stat, 'yh:stat_id')
-                            value = self._get_text(stat, 'yh:value')
-                            stats[stat_id] = self._parse_stat_value(value)
-                        if stats:
-                            stats['_is_average'] = False
-                            batch_results[player_key] = stats
-                    
-                    if batch_results:
-                        _set_cached(cache_key, batch_results, CACHE_TTL['player_stats'])
-                    return batch_results
+                    return parse_players(self._make_request(f"players;player_keys={keys_str}/stats"))
                 except Exception as e2:
                     return {}
 
+        fetched = {}
         with ThreadPoolExecutor(max_workers=min(10, len(batches_to_fetch))) as executor:
             future_to_batch = {executor.submit(fetch_batch, b): b for b in batches_to_fetch}
             for future in as_completed(future_to_batch):
                 batch_res = future.result()
                 if batch_res:
-                    results.update(batch_res)
-                    
+                    fetched.update(batch_res)
+        
+        # Cache from the request thread: worker threads have no session, so they
+        # would store entries under the wrong user prefix
+        _set_cached_many({f"player_stats:{k}": v for k, v in fetched.items()}, CACHE_TTL['player_stats'])
+        results.update(fetched)
         return results
     
     def get_player_stats_last30(self, player_keys: List[str]) -> Dict[str, Dict]: